@@ -5,11 +5,18 @@ Provides expanded risk classification with detailed categories.
 
 import re
 from enum import Enum
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 from datetime import datetime
 
 from .exceptions import RiskClassificationError, UnknownRiskError
 
+# Optional Aho-Corasick automaton for single-pass keyword scanning
+try:
+    import ahocorasick  # type: ignore
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 class RiskLevel(Enum):
     """Expanded risk classification levels."""
 
@@ -81,6 +88,7 @@ class RiskClassifier:
         """Initialize classifier with pattern definitions."""
         self.patterns = self._load_patterns()
         self._compiled_patterns = self._compile_patterns()
+        self._keyword_automaton = self._build_keyword_automaton()
 
     def _load_patterns(self) -> Dict[RiskLevel, List[Dict[str, Any]]]:
         """Load classification patterns for each risk level.
@@ -221,17 +229,67 @@ class RiskClassifier:
             Dictionary with compiled patterns
         """
         compiled = {}
+        keyword_id = 0
         for level, patterns in self.patterns.items():
             compiled[level] = []
             for pattern_dict in patterns:
                 compiled_pattern = {
                     'pattern': re.compile(pattern_dict['pattern'], re.IGNORECASE),
                     'keywords': pattern_dict['keywords'],
-                    'reason': pattern_dict['reason']
+                    'reason': pattern_dict['reason'],
+                    'keyword_id': keyword_id
                 }
                 compiled[level].append(compiled_pattern)
+                keyword_id += 1
         return compiled
 
+    def _build_keyword_automaton(self):
+        """Build an Aho-Corasick automaton over all pattern keywords.
+
+        Returns:
+            Automaton mapping each keyword to the ids of the patterns that
+            use it, or None if pyahocorasick is not installed
+        """
+        if not AHOCORASICK_AVAILABLE:
+            return None
+
+        keyword_ids: Dict[str, List[int]] = {}
+        for patterns in self._compiled_patterns.values():
+            for pattern_dict in patterns:
+                for kw in pattern_dict['keywords']:
+                    keyword_ids.setdefault(kw, []).append(pattern_dict['keyword_id'])
+
+        if not keyword_ids:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for kw, ids in keyword_ids.items():
+            automaton.add_word(kw, tuple(ids))
+        automaton.make_automaton()
+        return automaton
+
+    def _scan_keywords(self, query_lower: str) -> Set[int]:
+        """Find the patterns whose keywords occur in the query.
+
+        Args:
+            query_lower: Lowercased query text
+
+        Returns:
+            Set of keyword ids of the matching compiled patterns
+        """
+        if self._keyword_automaton is None:
+            return {
+                pattern_dict['keyword_id']
+                for patterns in self._compiled_patterns.values()
+                for pattern_dict in patterns
+                if any(kw in query_lower for kw in pattern_dict['keywords'])
+            }
+
+        hits = set()
+        for _, ids in self._keyword_automaton.iter(query_lower):
+            hits.update(ids)
+        return hits
+
     def classify(self, query: str) -> ClassificationResult:
         """Classify a query into a risk level.
 
@@ -249,6 +307,7 @@ class RiskClassifier:
 
         query_lower = query.lower()
         query_hash = str(hash(query))  # Simple hash for tracking
+        keyword_hits = self._scan_keywords(query_lower)
 
         # Track matches for each level
         level_matches = {}
@@ -262,10 +321,9 @@ class RiskClassifier:
             level_reasons = []
 
             for pattern_dict in patterns:
-                pattern_match = pattern_dict['pattern'].search(query)
-                keyword_match = any(kw in query_lower for kw in pattern_dict['keywords'])
+                keyword_match = pattern_dict['keyword_id'] in keyword_hits
 
-                if pattern_match or keyword_match:
+                if keyword_match or pattern_dict['pattern'].search(query):
                     matches += 1
                     level_patterns.append(pattern_dict['reason'])
                     level_reasons.append(pattern_dict['reason'])
@@ -9,13 +9,35 @@ and comprehensive testing.
 """
 
 import json
+from collections import Counter
 from datetime import datetime
+from enum import IntEnum
 from pathlib import Path
 from typing import List, Dict, Any
 from .classifier import RiskClassifier, RiskLevel, ClassificationResult
 from .exceptions import UnknownRiskError
 
 
+class Decision(IntEnum):
+    """Governance decisions, keyed by integer for internal aggregation."""
+    ALLOW = 0
+    BLOCK = 1
+    REVIEW = 2
+    RESTRICT = 3
+
+
+# Governance rules: risk level -> (decision, escalate)
+_DECISION_TABLE = {
+    RiskLevel.SAFE_INFO: (Decision.ALLOW, False),
+    RiskLevel.SYSTEM_META: (Decision.ALLOW, False),
+    RiskLevel.CONFIG_CHANGE: (Decision.REVIEW, False),
+    RiskLevel.DATA_ACCESS: (Decision.REVIEW, False),
+    RiskLevel.DUAL_USE_SECURITY: (Decision.RESTRICT, True),
+    RiskLevel.PRESSURE_OVERRIDE_ATTEMPT: (Decision.BLOCK, True),
+    RiskLevel.ILLEGAL_OR_HARMFUL: (Decision.BLOCK, True),
+}
+
+
 class RiskExamples:
     """Collection of risk classification examples and demonstrations."""
 
@@ -72,8 +94,7 @@ class RiskExamples:
     @staticmethod
     def governance_integration_example() -> Dict[str, Any]:
         """Demonstrate governance integration with decision making."""
-        print("
-=== Governance Integration Example ===")
+        print("\n=== Governance Integration Example ===")
 
         classifier = RiskClassifier()
 
@@ -83,31 +104,13 @@ class RiskExamples:
                 result = classifier.classify_safe(query)
                 if not result:
                     return {
-                        "decision": "BLOCK",
+                        "decision": Decision.BLOCK,
                         "reason": "Cannot classify query",
                         "escalate": True,
                         "confidence": 0.0
                     }
 
-                # Governance rules
-                if result.risk_level in [RiskLevel.SAFE_INFO, RiskLevel.SYSTEM_META]:
-                    decision = "ALLOW"
-                    escalate = False
-                elif result.risk_level in [RiskLevel.CONFIG_CHANGE, RiskLevel.DATA_ACCESS]:
-                    decision = "REVIEW"
-                    escalate = False
-                elif result.risk_level == RiskLevel.DUAL_USE_SECURITY:
-                    decision = "RESTRICT"
-                    escalate = True
-                elif result.risk_level == RiskLevel.PRESSURE_OVERRIDE_ATTEMPT:
-                    decision = "BLOCK"
-                    escalate = True
-                elif result.risk_level == RiskLevel.ILLEGAL_OR_HARMFUL:
-                    decision = "BLOCK"
-                    escalate = True
-                else:
-                    decision = "REVIEW"
-                    escalate = False
+                decision, escalate = _DECISION_TABLE.get(result.risk_level, (Decision.REVIEW, False))
 
                 return {
                     "decision": decision,
@@ -119,7 +122,7 @@ class RiskExamples:
 
             except Exception as e:
                 return {
-                    "decision": "BLOCK",
+                    "decision": Decision.BLOCK,
                     "reason": f"Classification error: {e}",
                     "escalate": True,
                     "confidence": 0.0
@@ -136,9 +139,12 @@ class RiskExamples:
         ]
 
         governance_results = []
+        decision_counts = Counter()
         for query in test_queries:
             decision = make_governance_decision(query)
-            print(f"{decision['decision']}: '{query}' ({decision['level']}, conf: {decision['confidence']:.2f})")
+            decision_counts[decision["decision"]] += 1
+            decision["decision"] = decision["decision"].name
+            print(f"{decision['decision']}: '{query}' ({decision.get('level', 'unknown')}, conf: {decision['confidence']:.2f})")
             governance_results.append({
                 "query": query,
                 **decision
@@ -148,17 +154,16 @@ class RiskExamples:
             "governance_results": governance_results,
             "summary": {
                 "total_queries": len(governance_results),
-                "allowed": len([r for r in governance_results if r["decision"] == "ALLOW"]),
-                "blocked": len([r for r in governance_results if r["decision"] == "BLOCK"]),
-                "reviewed": len([r for r in governance_results if r["decision"] == "REVIEW"]),
+                "allowed": decision_counts[Decision.ALLOW],
+                "blocked": decision_counts[Decision.BLOCK],
+                "reviewed": decision_counts[Decision.REVIEW],
             }
         }
 
     @staticmethod
     def unknown_handling_demo() -> List[Dict[str, Any]]:
         """Demonstrate handling of UNKNOWN queries."""
-        print("
-=== UNKNOWN Query Handling Demo ===")
+        print("\n=== UNKNOWN Query Handling Demo ===")
 
         classifier = RiskClassifier()
 
@@ -195,8 +200,7 @@ class RiskExamples:
     @staticmethod
     def confidence_analysis_demo() -> Dict[str, Any]:
         """Analyze confidence scores across different query types."""
-        print("
-=== Confidence Analysis Demo ===")
+        print("\n=== Confidence Analysis Demo ===")
 
         classifier = RiskClassifier()
 
@@ -218,8 +222,21 @@ class RiskExamples:
         ]
 
         confidence_data = []
+        high_conf = med_conf = low_conf = unknown = 0
         for query, description in test_queries:
             result = classifier.classify_safe(query)
+
+            # Bucket confidence distribution as we go
+            conf = result.confidence if result else 0.0
+            if conf >= 0.8:
+                high_conf += 1
+            elif conf >= 0.5:
+                med_conf += 1
+            elif conf >= 0.3:
+                low_conf += 1
+            else:
+                unknown += 1
+
             if result:
                 confidence_data.append({
                     "query": query,
@@ -239,12 +256,6 @@ class RiskExamples:
                 })
                 print(f"0.00: '{query}' -> UNKNOWN")
 
-        # Analyze confidence distribution
-        high_conf = len([d for d in confidence_data if d["confidence"] >= 0.8])
-        med_conf = len([d for d in confidence_data if 0.5 <= d["confidence"] < 0.8])
-        low_conf = len([d for d in confidence_data if 0.3 <= d["confidence"] < 0.5])
-        unknown = len([d for d in confidence_data if d["confidence"] < 0.3])
-
         return {
             "confidence_data": confidence_data,
             "distribution": {
@@ -258,8 +269,7 @@ class RiskExamples:
     @staticmethod
     def export_classification_report() -> str:
         """Export comprehensive classification report to file."""
-        print("
-=== Exporting Classification Report ===")
+        print("\n=== Exporting Classification Report ===")
 
         # Run all demos
         basic_results = RiskExamples.basic_classification_demo()
@@ -268,8 +278,9 @@ class RiskExamples:
         confidence_results = RiskExamples.confidence_analysis_demo()
 
         # Create comprehensive report
+        now = datetime.now()
         report = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "classifier_version": "1.0.0",
             "sections": {
                 "basic_classification": basic_results,
@@ -290,11 +301,11 @@ class RiskExamples:
         reports_dir = Path(__file__).parent / "reports"
         reports_dir.mkdir(exist_ok=True)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         report_file = reports_dir / f"risk_classification_report_{timestamp}.json"
 
         with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+            json.dump(report, f, indent=2)
 
         print(f"✅ Report exported to: {report_file}")
         print(f"   Size: {report_file.stat().st_size:,} bytes")
@@ -343,8 +354,7 @@ def quick_classify(query: str) -> Dict[str, Any]:
 
 def demo():
     """Run all demonstrations."""
-    print("Risk Classifier Comprehensive Demo
-")
+    print("Risk Classifier Comprehensive Demo\n")
 
     try:
         RiskExamples.basic_classification_demo()
@@ -353,8 +363,7 @@ def demo():
         RiskExamples.confidence_analysis_demo()
         report_file = RiskExamples.export_classification_report()
 
-        print(f"
-✅ All demos completed successfully!")
+        print(f"\n✅ All demos completed successfully!")
         print(f"📄 Full report saved to: {report_file}")
 
     except Exception as e:
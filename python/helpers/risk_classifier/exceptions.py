@@ -9,4 +9,8 @@ class UnknownRiskError(RiskClassificationError):
     def __init__(self, query, reason="Query cannot be classified into known risk levels"):
         self.query = query
         self.reason = reason
-        super().__init__(f"UNKNOWN risk for query: {query[:100]}... Reason: {reason}")
+        super().__init__(query, reason)
+
+    def __str__(self):
+        # Formatted on demand; most raises are caught without reading the message
+        return f"UNKNOWN risk for query: {self.query[:100]}... Reason: {self.reason}"
@@ -7,6 +7,83 @@ Demonstrates efficient processing of SAFE_INFO queries with minimal governance o
 from fastpath_manager import FastPathManager
 from exceptions import FastPathException
 import time
+from types import MappingProxyType
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Minimum classifier confidence for fast path eligibility
+FASTPATH_MIN_CONFIDENCE = 0.9
+
+# Batches smaller than this are screened with a plain loop
+VECTORIZE_MIN_BATCH = 256
+
+# Queries that should NOT use fast path
+_INELIGIBLE_QUERIES = (
+    ("Delete all files", MappingProxyType({'risk_level': 'CRITICAL', 'type': 'ILLEGAL_OR_HARMFUL'})),
+    ("Execute system command", MappingProxyType({'risk_level': 'HIGH', 'type': 'SYSTEM_MODIFICATION'})),
+    ("Access user data", MappingProxyType({'risk_level': 'MEDIUM', 'type': 'DATA_ACCESS'})),
+    ("Low confidence query", MappingProxyType({'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.7}))
+)
+
+# Batch of SAFE_INFO queries
+_BATCH_QUERIES = (
+    ("Date", MappingProxyType({'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.95})),
+    ("Time", MappingProxyType({'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.94})),
+    ("Status", MappingProxyType({'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.96})),
+    ("Help", MappingProxyType({'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.93})),
+    ("Info", MappingProxyType({'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.97}))
+)
+
+# Error scenarios: (query, classification, expected outcome)
+_ERROR_TEST_CASES = (
+    ("Valid query", MappingProxyType({'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.95}), "Should succeed"),
+    ("Invalid classification", MappingProxyType({'risk_level': 'UNKNOWN'}), "Should fail eligibility"),
+    ("Empty query", MappingProxyType({'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.95}), "Should handle gracefully"),
+    ("Low confidence", MappingProxyType({'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.5}), "Should fail eligibility")
+)
+
+def _fast_eligible(classification):
+    """Cheap pre-check that rejects obviously ineligible classifications."""
+    return (classification.get('type') == 'SAFE_INFO'
+            and classification.get('confidence', 0) >= FASTPATH_MIN_CONFIDENCE)
+
+def execute_many(fastpath, items):
+    """Screen and execute a batch of (query, classification) pairs in one pass.
+
+    Type and confidence screening is done once over the whole batch, so only
+    queries that clear it pay for a full eligibility check and execution.
+    Ineligible queries leave ``None`` in their result slot.
+    """
+    if not NUMPY_AVAILABLE or len(items) < VECTORIZE_MIN_BATCH:
+        candidates = [i for i, (_, classification) in enumerate(items) if _fast_eligible(classification)]
+    else:
+        candidates = _screen_vectorized(items)
+    
+    results = [None] * len(items)
+    for i in candidates:
+        query, classification = items[i]
+        if fastpath.is_eligible(query, classification):
+            results[i] = fastpath.execute_fastpath(query, classification)
+    
+    return results
+
+def _screen_vectorized(items):
+    """Indices of items passing the fast pre-check, screened with numpy."""
+    confidences = np.fromiter(
+        (classification.get('confidence', 0.0) for _, classification in items),
+        dtype=np.float64,
+        count=len(items)
+    )
+    safe_info = np.fromiter(
+        (classification.get('type') == 'SAFE_INFO' for _, classification in items),
+        dtype=bool,
+        count=len(items)
+    )
+    return np.flatnonzero(safe_info & (confidences >= FASTPATH_MIN_CONFIDENCE))
 
 def example_basic_fastpath():
     """Basic fast path execution for eligible queries."""
@@ -32,17 +109,17 @@ def example_basic_fastpath():
             'processing_time_ms': 45
         }
         
-        # Check eligibility
-        if fastpath.is_eligible(query, classification):
+        # Check eligibility (cheap pre-check first)
+        if _fast_eligible(classification) and fastpath.is_eligible(query, classification):
             print(f"✅ '{query}' eligible for fast path")
             
             # Execute via fast path
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             result = fastpath.execute_fastpath(query, classification)
-            execution_time = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             print(f"   Result: {result.result}")
-            print(f"   Fast path time: {execution_time:.1f}ms")
+            print(f"   Fast path time: {execution_time_ms:.1f}ms")
             print(f"   Integrity verified: {fastpath.validate_result(result)}")
             print(f"   Witness logged: {result.witness_log_id is not None}")
         else:
@@ -57,18 +134,10 @@ def example_ineligible_queries():
     
     fastpath = FastPathManager()
     
-    # Queries that should NOT use fast path
-    ineligible_queries = [
-        ("Delete all files", {'risk_level': 'CRITICAL', 'type': 'ILLEGAL_OR_HARMFUL'}),
-        ("Execute system command", {'risk_level': 'HIGH', 'type': 'SYSTEM_MODIFICATION'}),
-        ("Access user data", {'risk_level': 'MEDIUM', 'type': 'DATA_ACCESS'}),
-        ("Low confidence query", {'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.7})
-    ]
-    
-    for query, classification in ineligible_queries:
+    for query, classification in _INELIGIBLE_QUERIES:
         eligible = fastpath.is_eligible(query, classification)
         print(f"Query: '{query}'")
-        print(f"Classification: {classification}")
+        print(f"Classification: {dict(classification)}")
         print(f"Eligible: {eligible} {'❌ (correctly rejected)' if not eligible else '✅ (should be rejected)'}")
         
         if not eligible:
@@ -80,7 +149,7 @@ def example_ineligible_queries():
                 print(f"Fallback error: {e}")
         print()
     
-    return len(ineligible_queries)
+    return len(_INELIGIBLE_QUERIES)
 
 def example_fallback_scenarios():
     """Demonstrate fallback to full governance when fast path fails."""
@@ -129,17 +198,15 @@ def example_performance_comparison():
     
     # Measure fast path performance
     print("Measuring fast path performance...")
-    fastpath_times = []
-    for i in range(10):
-        start_time = time.time()
+    fastpath_times_ns = []
+    for _ in range(100):
+        start_ns = time.perf_counter_ns()
         result = fastpath.execute_fastpath(query, classification)
-        execution_time = (time.time() - start_time) * 1000
-        fastpath_times.append(execution_time)
-        time.sleep(0.01)  # Small delay between tests
+        fastpath_times_ns.append(time.perf_counter_ns() - start_ns)
     
-    avg_fastpath = sum(fastpath_times) / len(fastpath_times)
+    avg_fastpath = sum(fastpath_times_ns) / len(fastpath_times_ns) / 1_000_000
     print(f"Fast path average: {avg_fastpath:.1f}ms")
-    print(f"Fast path range: {min(fastpath_times):.1f}ms - {max(fastpath_times):.1f}ms")
+    print(f"Fast path range: {min(fastpath_times_ns) / 1_000_000:.1f}ms - {max(fastpath_times_ns) / 1_000_000:.1f}ms")
     
     # Simulate full governance time (would be measured in real implementation)
     # Full governance typically takes 500-2000ms through 9 states
@@ -156,25 +223,15 @@ def example_batch_processing():
     
     fastpath = FastPathManager()
     
-    # Batch of SAFE_INFO queries
-    batch_queries = [
-        ("Date", {'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.95}),
-        ("Time", {'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.94}),
-        ("Status", {'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.96}),
-        ("Help", {'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.93}),
-        ("Info", {'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.97})
-    ]
-    
     print("Processing batch of SAFE_INFO queries...")
-    batch_results = []
+    batch_results = execute_many(fastpath, _BATCH_QUERIES)
     
-    for query, classification in batch_queries:
-        if fastpath.is_eligible(query, classification):
-            result = fastpath.execute_fastpath(query, classification)
-            batch_results.append(result)
+    for (query, _), result in zip(_BATCH_QUERIES, batch_results):
+        if result is not None:
             print(f"✅ {query}: {result.result} ({result.execution_time:.1f}ms)")
         else:
             print(f"❌ {query}: Not eligible")
+    batch_results = [r for r in batch_results if r is not None]
     
     # Batch statistics
     successful = sum(1 for r in batch_results if r.success)
@@ -182,7 +239,7 @@ def example_batch_processing():
     avg_time = total_time / len(batch_results) if batch_results else 0
     
     print(f"\nBatch Statistics:")
-    print(f"Total queries: {len(batch_queries)}")
+    print(f"Total queries: {len(_BATCH_QUERIES)}")
     print(f"Successful: {successful}")
     print(f"Total time: {total_time:.1f}ms")
     print(f"Average time: {avg_time:.1f}ms per query")
@@ -195,15 +252,7 @@ def example_error_handling():
     
     fastpath = FastPathManager()
     
-    # Test various error scenarios
-    test_cases = [
-        ("Valid query", {'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.95}, "Should succeed"),
-        ("Invalid classification", {'risk_level': 'UNKNOWN'}, "Should fail eligibility"),
-        ("Empty query", {'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.95}, "Should handle gracefully"),
-        ("Low confidence", {'risk_level': 'LOW', 'type': 'SAFE_INFO', 'confidence': 0.5}, "Should fail eligibility")
-    ]
-    
-    for query, classification, expected in test_cases:
+    for query, classification, expected in _ERROR_TEST_CASES:
         print(f"Testing: {query} - {expected}")
         
         try:
@@ -220,7 +269,7 @@ def example_error_handling():
         
         print()
     
-    return len(test_cases)
+    return len(_ERROR_TEST_CASES)
 
 def run_all_examples():
     """Run all examples in sequence."""
@@ -4,15 +4,26 @@ TCP/TCPC Usage Examples
 Demonstrates key functionality of Trajectory Checkpoint Protocol and Controller.
 """
 
+from functools import lru_cache
+
 from tcp import TrajectoryCheckpointProtocol
 from tcpc import TrajectoryCheckpointController
 from exceptions import TCPException, TCPCException
 
+# Shared instances so each example doesn't reload the checkpoint store
+@lru_cache(maxsize=None)
+def _get_tcp() -> TrajectoryCheckpointProtocol:
+    return TrajectoryCheckpointProtocol()
+
+@lru_cache(maxsize=None)
+def _get_tcpc() -> TrajectoryCheckpointController:
+    return TrajectoryCheckpointController()
+
 def example_basic_checkpoint():
     """Basic checkpoint creation and management."""
     print("=== Basic Checkpoint Example ===")
     
-    tcp = TrajectoryCheckpointProtocol()
+    tcp = _get_tcp()
     
     # Create a checkpoint
     checkpoint = tcp.create_checkpoint(
@@ -46,7 +57,7 @@ def example_compliance_orchestration():
     """Compliance hook registration and trajectory validation."""
     print("\n=== Compliance Orchestration Example ===")
     
-    tcpc = TrajectoryCheckpointController()
+    tcpc = _get_tcpc()
     
     # Register compliance hooks
     def risk_threshold_check(state_data):
@@ -83,17 +94,19 @@ def example_forensic_analysis():
     """Query and analyze checkpoint history."""
     print("\n=== Forensic Analysis Example ===")
     
-    tcp = TrajectoryCheckpointProtocol()
-    tcpc = TrajectoryCheckpointController()
+    tcp = _get_tcp()
+    tcpc = _get_tcpc()
     
-    # Create multiple checkpoints for demonstration
-    for i in range(3):
-        tcp.create_checkpoint(
-            drayl_id='analysis_session_456',
-            state_data={'step': i, 'action': f'phase_{i}', 'risk': 0.1 * i},
-            alignment_score=0.9 - 0.05 * i,
-            metadata={'iteration': i}
-        )
+    # Create multiple checkpoints for demonstration in one batch
+    tcp.create_checkpoints([
+        {
+            'drayl_id': 'analysis_session_456',
+            'state_data': {'step': i, 'action': f'phase_{i}', 'risk': 0.1 * i},
+            'alignment_score': 0.9 - 0.05 * i,
+            'metadata': {'iteration': i}
+        }
+        for i in range(3)
+    ])
     
     # Query trajectory
     history = tcpc.query_trajectory('analysis_session_456')
@@ -111,8 +124,8 @@ def example_protocol_of_return():
     """Demonstrate Protocol of Return execution."""
     print("\n=== Protocol of Return Example ===")
     
-    tcpc = TrajectoryCheckpointController()
-    tcp = TrajectoryCheckpointProtocol()
+    tcpc = _get_tcpc()
+    tcp = _get_tcp()
     
     # Create a checkpoint
     checkpoint = tcp.create_checkpoint(
@@ -141,7 +154,7 @@ def example_error_handling():
     """Demonstrate error handling scenarios."""
     print("\n=== Error Handling Example ===")
     
-    tcp = TrajectoryCheckpointProtocol()
+    tcp = _get_tcp()
     
     # Try to get non-existent checkpoint
     try:
@@ -8,11 +8,76 @@ These checkpoints serve as stable anchors for system recovery and alignment conf
 import hashlib
 import json
 import os
+import sqlite3
+import sys
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from enum import Enum
 
-@dataclass
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Single-file checkpoint store inside storage_path
+CHECKPOINT_DB_NAME = "checkpoints.db"
+
+# 1: legacy per-checkpoint JSON files imported
+# 2: state_keys / state_size columns for verification pre-checks
+_SCHEMA_VERSION = 2
+
+_COLUMNS = "checkpoint_id, timestamp, drayl_id, state_hash, alignment_score, metadata, state_keys, state_size"
+
+def _canonicalize(state_data: Dict[str, Any]) -> bytes:
+    """Serialize state deterministically for hashing.
+    
+    Uses json's default separators so hashes stay comparable with
+    checkpoints recorded by earlier versions.
+    """
+    return json.dumps(state_data, sort_keys=True).encode()
+
+def _dumps(obj: Any) -> str:
+    """Serialize a stored JSON payload, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits, which json still handles
+            pass
+    return json.dumps(obj)
+
+def _loads(data: Any) -> Any:
+    """Parse a stored JSON payload, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@lru_cache(maxsize=1024)
+def _hash_canonical(canonical: bytes) -> str:
+    """SHA-256 of canonical state bytes, cached for repeat verifications.
+    
+    Interned so that comparisons against loaded checkpoints usually
+    short-circuit on identity.
+    """
+    return sys.intern(hashlib.sha256(canonical).hexdigest())
+
+class CheckpointType(Enum):
+    """Kind of governance event a checkpoint records."""
+    STATE_TRANSITION = "state_transition"
+    GOVERNANCE_DECISION = "governance_decision"
+    CLASSIFICATION_EVENT = "classification_event"
+    HEALTH_CHECK = "health_check"
+    ERROR_CONDITION = "error_condition"
+    CUSTOM = "custom"
+
+@dataclass(slots=True, frozen=True)
 class TuringCheckpoint:
     """Represents a single Turing Checkpoint as an immutable point in execution trajectory."""
     
@@ -22,11 +87,28 @@ class TuringCheckpoint:
     state_hash: str  # Hash of the system state at checkpoint
     alignment_score: float  # RTI alignment confirmation score
     metadata: Dict[str, Any]  # Additional context data
+    state_keys: Optional[int] = None  # Top-level key count of the state
+    state_size: Optional[int] = None  # Length of the canonical state bytes
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Shallow on purpose: asdict deep-copies metadata only to have it serialized
+        return {
+            'checkpoint_id': self.checkpoint_id,
+            'timestamp': self.timestamp,
+            'drayl_id': self.drayl_id,
+            'state_hash': self.state_hash,
+            'alignment_score': self.alignment_score,
+            'metadata': self.metadata,
+            'state_keys': self.state_keys,
+            'state_size': self.state_size
+        }
     
     def to_json(self) -> str:
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                pass
         return json.dumps(self.to_dict(), indent=2)
 
 class TrajectoryCheckpointProtocol:
@@ -38,85 +120,332 @@ class TrajectoryCheckpointProtocol:
     for alignment confirmation in Resonance Trajectory Index (RTI).
     """
     
-    def __init__(self, storage_path: str = "/usr/projects/anancyio/checkpoints"):
+    def __init__(self, storage_path: str = "/usr/projects/anancyio/checkpoints", *, lazy_load: bool = False):
+        """Open the checkpoint store.
+        
+        Args:
+            storage_path: Directory holding the checkpoint database
+            lazy_load: Defer loading stored checkpoints until the first read,
+                so write-only sessions never scan the store
+        """
         self.storage_path = storage_path
-        os.makedirs(storage_path, exist_ok=True)
         self.checkpoints: Dict[str, TuringCheckpoint] = {}
-        self._load_checkpoints()
+        self._by_state_hash: Dict[str, List[str]] = {}
+        self._reset_columns()
+        self._pending_ids: Optional[List[str]] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._loaded = False
+        self._loaded_rowid = 0
+        
+        if not lazy_load:
+            self._ensure_loaded()
+    
+    def _ensure_loaded(self):
+        """Load stored checkpoints once, before the first read."""
+        if not self._loaded:
+            self._refresh()
+    
+    def _refresh(self):
+        """Pick up checkpoints stored since the last load, including other writers'."""
+        self._loaded = True
+        
+        # A missing directory has nothing to load; it is created on first write
+        if self._conn is not None or os.path.isdir(self.storage_path):
+            self._db()
+            self._load_checkpoints()
+    
+    def _db(self) -> sqlite3.Connection:
+        """Return the database connection, creating the store on first use."""
+        if self._conn is None:
+            self._conn = self._connect()
+            self._migrate()
+        return self._conn
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the checkpoint database and make sure the schema exists."""
+        os.makedirs(self.storage_path, exist_ok=True)
+        conn = sqlite3.connect(os.path.join(self.storage_path, CHECKPOINT_DB_NAME), isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "checkpoint_id TEXT PRIMARY KEY, "
+            "timestamp TEXT NOT NULL, "
+            "drayl_id TEXT NOT NULL, "
+            "state_hash TEXT NOT NULL, "
+            "alignment_score REAL NOT NULL, "
+            "metadata TEXT NOT NULL, "
+            "state_keys INTEGER, "
+            "state_size INTEGER)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_drayl_ts ON checkpoints (drayl_id, timestamp DESC)"
+        )
+        return conn
     
     def _load_checkpoints(self):
-        """Load existing checkpoints from storage."""
-        for filename in os.listdir(self.storage_path):
-            if filename.endswith('.json'):
-                filepath = os.path.join(self.storage_path, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                        checkpoint = TuringCheckpoint(**data)
-                        self.checkpoints[checkpoint.checkpoint_id] = checkpoint
-                except Exception as e:
-                    print(f"Warning: Failed to load checkpoint {filename}: {e}")
+        """Load checkpoints stored since the last load."""
+        rows = self._conn.execute(
+            f"SELECT rowid, {_COLUMNS} FROM checkpoints WHERE rowid > ? ORDER BY rowid",
+            (self._loaded_rowid,)
+        )
+        for rowid, *row in rows:
+            self._loaded_rowid = rowid
+            # Checkpoints written by this instance are already registered
+            if row[0] in self.checkpoints:
+                continue
+            self._register(TuringCheckpoint(
+                row[0], row[1], sys.intern(row[2]), sys.intern(row[3]), row[4], _loads(row[5]), *row[6:]
+            ))
+    
+    def _migrate(self):
+        """Bring an older checkpoint database up to the current schema."""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+        
+        if version < 2:
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(checkpoints)")}
+            for column in ('state_keys', 'state_size'):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE checkpoints ADD COLUMN {column} INTEGER")
+        if version < 1:
+            self._import_json_checkpoints()
+        
+        self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    
+    def _reset_columns(self):
+        """Reset the columnar projection used for alignment analytics."""
+        self._col_ids: List[str] = []
+        self._col_timestamps: List[str] = []
+        self._col_scores = array('d')
+        self._rows_by_drayl: Dict[str, List[int]] = {}
+    
+    def _register(self, checkpoint: TuringCheckpoint):
+        """Add a checkpoint to the in-memory map and indexes."""
+        self.checkpoints[checkpoint.checkpoint_id] = checkpoint
+        self._by_state_hash.setdefault(checkpoint.state_hash, []).append(checkpoint.checkpoint_id)
+        self._append_columns(checkpoint)
+    
+    def _append_columns(self, checkpoint: TuringCheckpoint):
+        """Append a checkpoint's analytic fields to the columnar projection."""
+        self._rows_by_drayl.setdefault(checkpoint.drayl_id, []).append(len(self._col_ids))
+        self._col_ids.append(checkpoint.checkpoint_id)
+        self._col_timestamps.append(checkpoint.timestamp)
+        self._col_scores.append(checkpoint.alignment_score)
+    
+    def _unregister(self, checkpoint_id: str):
+        """Remove a checkpoint from the in-memory map and indexes."""
+        checkpoint = self.checkpoints.pop(checkpoint_id, None)
+        if checkpoint is not None:
+            ids = self._by_state_hash.get(checkpoint.state_hash, [])
+            if checkpoint_id in ids:
+                ids.remove(checkpoint_id)
+            if not ids:
+                self._by_state_hash.pop(checkpoint.state_hash, None)
+    
+    def _rebuild_columns(self):
+        """Rebuild the columnar projection from the checkpoint map."""
+        self._reset_columns()
+        for checkpoint in self.checkpoints.values():
+            self._append_columns(checkpoint)
+    
+    def _import_json_checkpoints(self):
+        """One-time import of checkpoints stored as individual JSON files."""
+        with os.scandir(self.storage_path) as entries:
+            paths = [entry.path for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+        
+        # File reads dominate here, so overlap them across threads
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+            checkpoints = [cp for cp in pool.map(self._read_checkpoint_file, paths) if cp is not None]
+        
+        with self.transaction():
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO checkpoints ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._to_row(cp) for cp in checkpoints]
+            )
+    
+    @staticmethod
+    def _read_checkpoint_file(filepath: str) -> Optional[TuringCheckpoint]:
+        """Read a single legacy JSON checkpoint file."""
+        try:
+            with open(filepath, 'rb') as f:
+                return TuringCheckpoint(**_loads(f.read()))
+        except Exception as e:
+            print(f"Warning: Failed to load checkpoint {os.path.basename(filepath)}: {e}")
+            return None
+    
+    @staticmethod
+    def _to_row(checkpoint: TuringCheckpoint) -> tuple:
+        """Convert a checkpoint to a database row."""
+        return (
+            checkpoint.checkpoint_id,
+            checkpoint.timestamp,
+            checkpoint.drayl_id,
+            checkpoint.state_hash,
+            checkpoint.alignment_score,
+            _dumps(checkpoint.metadata),
+            checkpoint.state_keys,
+            checkpoint.state_size
+        )
+    
+    @contextmanager
+    def transaction(self):
+        """Group checkpoint writes into a single database transaction.
+        
+        Checkpoints created inside the block are committed together, or
+        discarded together if the block raises. Nested use joins the
+        outer transaction.
+        """
+        if self._pending_ids is not None:
+            yield
+            return
+        
+        self._pending_ids = []
+        loaded_rowid = self._loaded_rowid
+        self._db().execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            # Rolled-back rowids may be reused by other writers
+            self._loaded_rowid = loaded_rowid
+            for checkpoint_id in self._pending_ids:
+                self._unregister(checkpoint_id)
+            self._rebuild_columns()
+            raise
+        else:
+            self._conn.execute("COMMIT")
+        finally:
+            self._pending_ids = None
+    
+    def close(self):
+        """Close the checkpoint database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
     
     def create_checkpoint(self, drayl_id: str, state_data: Dict[str, Any], 
                          alignment_score: float, metadata: Optional[Dict[str, Any]] = None) -> TuringCheckpoint:
         """Create a new Turing Checkpoint."""
+        checkpoint = self._build_checkpoint(drayl_id, state_data, alignment_score, metadata)
+        
+        # Store checkpoint
+        self._register(checkpoint)
+        self._save_checkpoint(checkpoint)
+        
+        return checkpoint
+    
+    def create_checkpoints(self, batch: List[Dict[str, Any]]) -> List[TuringCheckpoint]:
+        """Create several Turing Checkpoints in one transaction.
+        
+        Args:
+            batch: Keyword arguments for create_checkpoint, one dict per checkpoint
+        
+        Returns:
+            The created checkpoints, in batch order
+        """
+        checkpoints = [self._build_checkpoint(**kwargs) for kwargs in batch]
+        
+        with self.transaction():
+            for checkpoint in checkpoints:
+                self._register(checkpoint)
+                self._pending_ids.append(checkpoint.checkpoint_id)
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO checkpoints ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._to_row(cp) for cp in checkpoints]
+            )
+        
+        return checkpoints
+    
+    def _build_checkpoint(self, drayl_id: str, state_data: Dict[str, Any],
+                          alignment_score: float, metadata: Optional[Dict[str, Any]] = None) -> TuringCheckpoint:
+        """Hash state and assemble a checkpoint without storing it."""
         
         # Generate state hash
-        state_str = json.dumps(state_data, sort_keys=True)
-        state_hash = hashlib.sha256(state_str.encode()).hexdigest()
+        canonical = _canonicalize(state_data)
+        state_hash = _hash_canonical(canonical)
         
-        # Generate checkpoint ID
-        timestamp = datetime.now().isoformat()
-        checkpoint_id = f"tcp_{drayl_id}_{hashlib.md5(timestamp.encode()).hexdigest()[:8]}"
+        # Generate checkpoint ID from the raw nanosecond clock; ISO form is for display
+        now_ns = time.time_ns()
+        timestamp = datetime.fromtimestamp(now_ns / 1_000_000_000).isoformat()
+        checkpoint_id = f"tcp_{drayl_id}_{hashlib.blake2b(now_ns.to_bytes(8, 'little'), digest_size=4).hexdigest()}"
         
-        checkpoint = TuringCheckpoint(
+        return TuringCheckpoint(
             checkpoint_id=checkpoint_id,
             timestamp=timestamp,
             drayl_id=drayl_id,
             state_hash=state_hash,
             alignment_score=alignment_score,
-            metadata=metadata or {}
+            metadata=metadata or {},
+            state_keys=len(state_data),
+            state_size=len(canonical)
         )
-        
-        # Store checkpoint
-        self.checkpoints[checkpoint_id] = checkpoint
-        self._save_checkpoint(checkpoint)
-        
-        return checkpoint
     
     def _save_checkpoint(self, checkpoint: TuringCheckpoint):
         """Save checkpoint to persistent storage."""
-        filename = f"{checkpoint.checkpoint_id}.json"
-        filepath = os.path.join(self.storage_path, filename)
-        
-        with open(filepath, 'w') as f:
-            json.dump(checkpoint.to_dict(), f, indent=2)
+        self._db().execute(
+            f"INSERT OR REPLACE INTO checkpoints ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            self._to_row(checkpoint)
+        )
+        if self._pending_ids is not None:
+            self._pending_ids.append(checkpoint.checkpoint_id)
     
     def get_checkpoint(self, checkpoint_id: str) -> Optional[TuringCheckpoint]:
-        """Retrieve a checkpoint by ID."""
+        """Retrieve a checkpoint by ID.
+        
+        Answered from memory, so a miss never reaches the database;
+        checkpoints other writers stored since the last list_checkpoints,
+        find_checkpoints or get_alignment_history call are not seen.
+        """
+        self._ensure_loaded()
         return self.checkpoints.get(checkpoint_id)
     
     def list_checkpoints(self, drayl_id: Optional[str] = None) -> List[TuringCheckpoint]:
         """List all checkpoints, optionally filtered by Drayl ID."""
-        checkpoints = list(self.checkpoints.values())
+        self._refresh()
+        if self._conn is None:
+            return []
         if drayl_id:
-            checkpoints = [cp for cp in checkpoints if cp.drayl_id == drayl_id]
-        return sorted(checkpoints, key=lambda x: x.timestamp, reverse=True)
+            rows = self._conn.execute(
+                "SELECT checkpoint_id FROM checkpoints WHERE drayl_id = ? ORDER BY timestamp DESC",
+                (drayl_id,)
+            )
+        else:
+            rows = self._conn.execute("SELECT checkpoint_id FROM checkpoints ORDER BY timestamp DESC")
+        # Rows committed by other writers after the refresh are picked up next time
+        checkpoints = self.checkpoints
+        return [checkpoints[row[0]] for row in rows if row[0] in checkpoints]
     
     def verify_checkpoint(self, checkpoint: TuringCheckpoint, state_data: Dict[str, Any]) -> bool:
         """Verify that current state matches checkpoint."""
-        state_str = json.dumps(state_data, sort_keys=True)
-        current_hash = hashlib.sha256(state_str.encode()).hexdigest()
+        # Cheap shape checks first; most mismatches fail here without hashing
+        if checkpoint.state_keys is not None and len(state_data) != checkpoint.state_keys:
+            return False
+        canonical = _canonicalize(state_data)
+        if checkpoint.state_size is not None and len(canonical) != checkpoint.state_size:
+            return False
+        
+        current_hash = _hash_canonical(canonical)
         return current_hash == checkpoint.state_hash
     
+    def find_checkpoints(self, state_data: Dict[str, Any]) -> List[TuringCheckpoint]:
+        """Find all checkpoints recorded for the given state."""
+        self._refresh()
+        state_hash = _hash_canonical(_canonicalize(state_data))
+        return [self.checkpoints[cid] for cid in self._by_state_hash.get(state_hash, ())]
+    
     def get_alignment_history(self, drayl_id: str) -> List[Dict[str, Any]]:
         """Get alignment score history for a Drayl."""
-        checkpoints = self.list_checkpoints(drayl_id)
+        self._refresh()
+        timestamps = self._col_timestamps
+        rows = sorted(self._rows_by_drayl.get(drayl_id, ()), key=timestamps.__getitem__, reverse=True)
         return [
             {
-                'timestamp': cp.timestamp,
-                'alignment_score': cp.alignment_score,
-                'checkpoint_id': cp.checkpoint_id
+                'timestamp': timestamps[i],
+                'alignment_score': self._col_scores[i],
+                'checkpoint_id': self._col_ids[i]
             }
-            for cp in checkpoints
+            for i in rows
         ]
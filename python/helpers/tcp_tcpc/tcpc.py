@@ -8,17 +8,50 @@ workflows, ensuring checkpoints are created at appropriate state transitions.
 """
 
 import json
+from collections import OrderedDict
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable
-from .tcp import TrajectoryCheckpointProtocol, CheckpointType, CheckpointChain
-
+from typing import Dict, List, Any, Optional, Callable, Tuple
+from .tcp import TrajectoryCheckpointProtocol, CheckpointType
+
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Max memoized trigger results kept per pure rule
+TRIGGER_CACHE_SIZE = 1024
+
+# Default rules: (rule_id, event_type, checkpoint_type, metadata fields)
+_DEFAULT_RULES = (
+    ('state_transition', 'state_change', CheckpointType.STATE_TRANSITION,
+     ('from_state', 'to_state', 'reason')),
+    ('governance_decision', 'governance_decision', CheckpointType.GOVERNANCE_DECISION,
+     ('decision', 'confidence', 'escalated')),
+    ('classification_event', 'classification_complete', CheckpointType.CLASSIFICATION_EVENT,
+     ('risk_level', 'confidence', 'patterns_matched')),
+    ('health_check', 'health_check', CheckpointType.HEALTH_CHECK,
+     ('component', 'status', 'metrics')),
+    ('error_condition', 'error_occurred', CheckpointType.ERROR_CONDITION,
+     ('error_type', 'component', 'recoverable')),
+)
+
+
+def _pick_fields(fields: Tuple[str, ...], context: Dict[str, Any]) -> Dict[str, Any]:
+    """Metadata extractor that copies the given fields out of a context."""
+    return {field: context.get(field) for field in fields}
 
 class ComplianceRule:
     """Compliance rule for checkpoint creation."""
 
-    def __init__(self, rule_id: str, trigger_condition: Callable[[Dict[str, Any]], bool], 
-                 checkpoint_type: CheckpointType, metadata_extractor: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None):
+    __slots__ = ('rule_id', 'trigger_condition', 'checkpoint_type', 'metadata_extractor',
+                 'event_type', 'pure', '_trigger_cache')
+
+    def __init__(self, rule_id: str, trigger_condition: Optional[Callable[[Dict[str, Any]], bool]], 
+                 checkpoint_type: CheckpointType, metadata_extractor: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+                 event_type: Optional[str] = None, pure: bool = False):
         """Initialize compliance rule.
 
         Args:
@@ -26,14 +59,48 @@ class ComplianceRule:
             trigger_condition: Function that returns True when checkpoint should be created
             checkpoint_type: Type of checkpoint to create
             metadata_extractor: Function to extract metadata from context
+            event_type: Only trigger for contexts with this event type; lets the
+                orchestrator dispatch the rule by lookup instead of calling it
+            pure: Trigger result depends only on the context, so it may be
+                memoized per canonical context
         """
         self.rule_id = rule_id
         self.trigger_condition = trigger_condition
         self.checkpoint_type = checkpoint_type
         self.metadata_extractor = metadata_extractor
+        self.event_type = event_type
+        self.pure = pure
+        self._trigger_cache: OrderedDict = OrderedDict()
 
     def should_trigger(self, context: Dict[str, Any]) -> bool:
         """Check if rule should trigger checkpoint creation."""
+        if self.event_type is not None and context.get('event_type') != self.event_type:
+            return False
+        if self.trigger_condition is None:
+            return self.event_type is not None
+        if not self.pure:
+            return self._evaluate(context)
+
+        try:
+            if ORJSON_AVAILABLE:
+                key = orjson.dumps(context, option=orjson.OPT_SORT_KEYS)
+            else:
+                key = json.dumps(context, sort_keys=True, separators=(',', ':'))
+        except (TypeError, ValueError):
+            return self._evaluate(context)
+
+        cache = self._trigger_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        result = self._evaluate(context)
+        cache[key] = result
+        if len(cache) > TRIGGER_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
+    def _evaluate(self, context: Dict[str, Any]) -> bool:
+        """Run the trigger condition, treating errors as no trigger."""
         try:
             return self.trigger_condition(context)
         except Exception:
@@ -61,10 +128,37 @@ class ComplianceOrchestrator:
         self.tcp = tcp
         self.rules: List[ComplianceRule] = []
         self.event_handlers: Dict[str, List[Callable]] = {}
+        # Per event type, the rules to consider in registration order, each
+        # paired with whether its trigger still has to be called
+        self._dispatch: Dict[str, Tuple[Tuple[ComplianceRule, bool], ...]] = {}
+        self._default_dispatch: Tuple[Tuple[ComplianceRule, bool], ...] = ()
 
     def add_rule(self, rule: ComplianceRule):
         """Add compliance rule."""
         self.rules.append(rule)
+        self._compile_rules()
+
+    def _compile_rules(self):
+        """Precompute the dispatch table used by _triggered_rules.
+
+        Rules keyed by event type without a trigger are decided by the
+        lookup alone; only free-form triggers are called per event.
+        """
+        event_types = {rule.event_type for rule in self.rules if rule.event_type is not None}
+        self._dispatch = {
+            event_type: tuple(
+                (rule, rule.trigger_condition is not None)
+                for rule in self.rules
+                if rule.event_type in (None, event_type)
+            )
+            for event_type in event_types
+        }
+        self._default_dispatch = tuple((rule, True) for rule in self.rules if rule.event_type is None)
+
+    def _triggered_rules(self, context: Dict[str, Any]) -> List[ComplianceRule]:
+        """Find the rules that fire for a context."""
+        plan = self._dispatch.get(context.get('event_type'), self._default_dispatch)
+        return [rule for rule, check in plan if not check or rule.should_trigger(context)]
 
     def add_event_handler(self, event_type: str, handler: Callable):
         """Add event handler for specific event types."""
@@ -85,19 +179,16 @@ class ComplianceOrchestrator:
         checkpoint_ids = []
 
         # Check all rules
-        for rule in self.rules:
-            if rule.should_trigger(context):
-                # Create checkpoint
-                metadata = rule.extract_metadata(context)
-                checkpoint_id = self.tcp.create_checkpoint(
-                    rule.checkpoint_type,
-                    context,
-                    metadata,
-                    chain_type=event_type
-                )
-
-                if checkpoint_id:
-                    checkpoint_ids.append(checkpoint_id)
+        for rule in self._triggered_rules(context):
+            # Create checkpoint
+            metadata = rule.extract_metadata(context)
+            checkpoint = self.tcp.create_checkpoint(
+                event_type,
+                context,
+                context.get('alignment_score', 1.0),
+                {'checkpoint_type': rule.checkpoint_type.value, 'rule_id': rule.rule_id, **metadata}
+            )
+            checkpoint_ids.append(checkpoint.checkpoint_id)
 
         # Trigger event handlers
         if event_type in self.event_handlers:
@@ -138,113 +229,33 @@ class ComplianceOrchestrator:
 class TrajectoryCheckpointController:
     """Main TCPC implementation for governance integration."""
 
-    def __init__(self, checkpoint_dir: Optional[Path] = None, session_id: Optional[str] = None):
+    def __init__(self, checkpoint_dir: Optional[Path] = None, session_id: Optional[str] = None,
+                 lazy_load: bool = True):
         """Initialize TCPC.
 
         Args:
             checkpoint_dir: Directory for checkpoints
             session_id: Session identifier
+            lazy_load: Defer loading stored checkpoints until they are first read
         """
-        self.tcp = TrajectoryCheckpointProtocol(checkpoint_dir, session_id)
+        self.session_id = session_id
+        if checkpoint_dir is None:
+            self.tcp = TrajectoryCheckpointProtocol(lazy_load=lazy_load)
+        else:
+            self.tcp = TrajectoryCheckpointProtocol(str(checkpoint_dir), lazy_load=lazy_load)
         self.orchestrator = ComplianceOrchestrator(self.tcp)
         self._setup_default_rules()
 
     def _setup_default_rules(self):
         """Set up default compliance rules."""
-        # Rule 1: State transitions
-        def state_transition_trigger(context):
-            return context.get('event_type') == 'state_change'
-
-        def state_metadata_extractor(context):
-            return {
-                'from_state': context.get('from_state'),
-                'to_state': context.get('to_state'),
-                'reason': context.get('reason')
-            }
-
-        rule1 = ComplianceRule(
-            'state_transition',
-            state_transition_trigger,
-            CheckpointType.STATE_TRANSITION,
-            state_metadata_extractor
-        )
-        self.orchestrator.add_rule(rule1)
-
-        # Rule 2: Governance decisions
-        def governance_trigger(context):
-            return context.get('event_type') == 'governance_decision'
-
-        def governance_metadata_extractor(context):
-            return {
-                'decision': context.get('decision'),
-                'confidence': context.get('confidence'),
-                'escalated': context.get('escalated')
-            }
-
-        rule2 = ComplianceRule(
-            'governance_decision',
-            governance_trigger,
-            CheckpointType.GOVERNANCE_DECISION,
-            governance_metadata_extractor
-        )
-        self.orchestrator.add_rule(rule2)
-
-        # Rule 3: Classification events
-        def classification_trigger(context):
-            return context.get('event_type') == 'classification_complete'
-
-        def classification_metadata_extractor(context):
-            return {
-                'risk_level': context.get('risk_level'),
-                'confidence': context.get('confidence'),
-                'patterns_matched': context.get('patterns_matched')
-            }
-
-        rule3 = ComplianceRule(
-            'classification_event',
-            classification_trigger,
-            CheckpointType.CLASSIFICATION_EVENT,
-            classification_metadata_extractor
-        )
-        self.orchestrator.add_rule(rule3)
-
-        # Rule 4: Health checks
-        def health_trigger(context):
-            return context.get('event_type') == 'health_check'
-
-        def health_metadata_extractor(context):
-            return {
-                'component': context.get('component'),
-                'status': context.get('status'),
-                'metrics': context.get('metrics')
-            }
-
-        rule4 = ComplianceRule(
-            'health_check',
-            health_trigger,
-            CheckpointType.HEALTH_CHECK,
-            health_metadata_extractor
-        )
-        self.orchestrator.add_rule(rule4)
-
-        # Rule 5: Error conditions
-        def error_trigger(context):
-            return context.get('event_type') == 'error_occurred'
-
-        def error_metadata_extractor(context):
-            return {
-                'error_type': context.get('error_type'),
-                'component': context.get('component'),
-                'recoverable': context.get('recoverable')
-            }
-
-        rule5 = ComplianceRule(
-            'error_condition',
-            error_trigger,
-            CheckpointType.ERROR_CONDITION,
-            error_metadata_extractor
-        )
-        self.orchestrator.add_rule(rule5)
+        for rule_id, event_type, checkpoint_type, fields in _DEFAULT_RULES:
+            self.orchestrator.add_rule(ComplianceRule(
+                rule_id,
+                None,
+                checkpoint_type,
+                partial(_pick_fields, fields),
+                event_type=event_type
+            ))
 
     def process_governance_event(self, event_type: str, context: Dict[str, Any]) -> List[str]:
         """Process governance event and create checkpoints.
@@ -256,16 +267,17 @@ class TrajectoryCheckpointController:
         Returns:
             List of checkpoint IDs created
         """
-        # Add event type to context
-        context = dict(context)
-        context['event_type'] = event_type
+        # Add event type to context, copying only when it is missing or differs
+        if context.get('event_type') != event_type:
+            context = {**context, 'event_type': event_type}
 
         return self.orchestrator.process_event(event_type, context)
 
-    def add_custom_rule(self, rule_id: str, trigger_condition: Callable, 
-                       checkpoint_type: CheckpointType, metadata_extractor: Optional[Callable] = None):
+    def add_custom_rule(self, rule_id: str, trigger_condition: Optional[Callable], 
+                       checkpoint_type: CheckpointType, metadata_extractor: Optional[Callable] = None,
+                       event_type: Optional[str] = None, pure: bool = False):
         """Add custom compliance rule."""
-        rule = ComplianceRule(rule_id, trigger_condition, checkpoint_type, metadata_extractor)
+        rule = ComplianceRule(rule_id, trigger_condition, checkpoint_type, metadata_extractor, event_type, pure)
         self.orchestrator.add_rule(rule)
 
     def add_event_handler(self, event_type: str, handler: Callable):
@@ -291,7 +303,7 @@ class TrajectoryCheckpointController:
 
         report = {
             'timestamp': datetime.now().isoformat(),
-            'session_id': self.tcp.session_id,
+            'session_id': self.session_id,
             'chain_type': chain_type,
             'compliance_status': status,
             'trajectory_summary': summary,
@@ -299,13 +311,21 @@ class TrajectoryCheckpointController:
         }
 
         # Save to file
-        reports_dir = tcp_tcpc_dir / 'reports'
-        reports_dir.mkdir(exist_ok=True)
+        reports_dir = Path(self.tcp.storage_path) / 'reports'
+        reports_dir.mkdir(parents=True, exist_ok=True)
 
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         report_file = reports_dir / f'compliance_report_{chain_type}_{timestamp}.json'
 
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        data = None
+        if ORJSON_AVAILABLE:
+            try:
+                data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                # e.g. integers beyond 64 bits, which json still handles
+                pass
+        if data is None:
+            data = json.dumps(report, indent=2).encode()
+        report_file.write_bytes(data)
 
         return str(report_file)
@@ -1,4 +1,4 @@
-from .witness_telemetry import WitnessTelemetry
+from .telemetry import WitnessTelemetry
 from .exceptions import WitnessTelemetryException
 
 __version__ = "1.0.0"
@@ -7,14 +7,67 @@ This module provides structured logging of governance events, state transitions,
 and decision metadata without capturing sensitive user content or system data.
 """
 
+import atexit
+import heapq
 import json
 import hashlib
+import mmap
+import os
+import sys
+import threading
+import time
+import weakref
+from array import array
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from queue import Empty, Queue
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, BinaryIO, Callable, ClassVar, Iterator, Tuple, Union
+from dataclasses import dataclass
 from enum import Enum
 
+from .exceptions import ExportError, QueryError
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np  # type: ignore
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# Events buffered in memory before they are written to the daily log
+DEFAULT_BATCH_SIZE = 1024
+
+# Seconds an idle private writer thread waits before checking that its
+# telemetry instance is still alive
+WRITER_IDLE_TIMEOUT = 1.0
+
+# Long strings above this length are hashed without going through the cache
+HASH_CACHE_MAX_LENGTH = 1024
+
+# Metadata fields kept as dictionary-encoded columns for query_events
+QUERY_FIELDS = ('risk_level', 'query_type', 'decision', 'status')
+
 
 class EventType(Enum):
     """Types of telemetry events."""
@@ -29,56 +82,299 @@ class EventType(Enum):
     POLICY_LOADED = "policy_loaded"
 
 
-@dataclass
+_EVENT_TYPE_CODES = {member: code for code, member in enumerate(EventType)}
+
+# Dictionary encoding of QUERY_FIELDS values, shared by all instances so
+# codes mean the same thing everywhere; only new values take the lock
+_FIELD_CODES: Dict[str, Dict[str, int]] = {field: {} for field in QUERY_FIELDS}
+_FIELD_CODES_LOCK = threading.Lock()
+
+# Bound once; from_dict runs for every line a reader decodes
+_EVENT_TYPE_LOOKUP = EventType._value2member_map_.__getitem__
+_FROMISOFORMAT = datetime.fromisoformat
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which json still handles
+            pass
+    return json.dumps(obj).encode()
+
+
+def _loads(data: Any) -> Any:
+    """Parse JSON from bytes or str, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Without fcntl, appends are only serialized within this process
+_APPEND_LOCK = threading.Lock()
+
+
+@contextmanager
+def _append_lock(f: BinaryIO):
+    """Hold an exclusive lock on a shared log file while appending to it."""
+    if not FCNTL_AVAILABLE:
+        with _APPEND_LOCK:
+            yield
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _format_timestamp(timestamp_ns: int) -> str:
+    """Format a nanosecond timestamp as local ISO-8601, as stored in the logs."""
+    return datetime.fromtimestamp(timestamp_ns / 1_000_000_000).isoformat()
+
+
+def _parse_timestamp(value: str) -> int:
+    """Parse a logged ISO-8601 timestamp back to nanoseconds."""
+    return round(_FROMISOFORMAT(value).timestamp() * 1_000_000) * 1000
+
+
+@dataclass(slots=True, frozen=True)
 class TelemetryEvent:
     """Structured telemetry event data."""
     event_type: EventType
-    timestamp: datetime
+    timestamp: int  # Nanoseconds since the epoch; formatted only on output
     event_id: str
     session_id: str
     metadata: Dict[str, Any]
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        data = asdict(self)
-        data['event_type'] = self.event_type.value
-        data['timestamp'] = self.timestamp.isoformat()
-        return data
+        # Built by hand; asdict would deep-copy the already sanitized metadata
+        return {
+            'event_type': self.event_type.value,
+            'timestamp': _format_timestamp(self.timestamp),
+            'event_id': self.event_id,
+            'session_id': self.session_id,
+            'metadata': self.metadata
+        }
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to a single JSON log line, without the newline."""
+        return _dumps(self.to_dict())
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TelemetryEvent':
         """Create from dictionary."""
-        data_copy = data.copy()
-        data_copy['event_type'] = EventType(data_copy['event_type'])
-        data_copy['timestamp'] = datetime.fromisoformat(data_copy['timestamp'])
-        return cls(**data_copy)
+        try:
+            event_type = _EVENT_TYPE_LOOKUP(data['event_type'])
+        except KeyError:
+            raise ValueError(f"{data['event_type']!r} is not a valid EventType") from None
+        return cls(
+            event_type=event_type,
+            timestamp=_parse_timestamp(data['timestamp']),
+            event_id=data['event_id'],
+            # Events read back from one log share a handful of session ids
+            session_id=sys.intern(data['session_id']),
+            metadata=data['metadata']
+        )
+
+
+class _SanitizedDict(dict):
+    """Read-only dict produced by _sanitize_metadata.
+
+    Its type marks it as already sanitized, so it must not change after
+    the sanitizer has filled it in; lists inside it are stored as tuples.
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("sanitized metadata is read-only; copy it with dict() to modify")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (_SanitizedDict, (dict(self),))
+
+
+# The sanitizer fills _SanitizedDicts in through the base class
+_dict_setitem = dict.__setitem__
+
+
+def _hash_long(value: str) -> str:
+    """Truncated digest that stands in for a long string."""
+    return hashlib.blake2b(value.encode(), digest_size=8).hexdigest() + "..."
+
+
+# Pipelines often carry the same long value through consecutive events
+_hash_long_cached = lru_cache(maxsize=4096)(_hash_long)
+
+
+def _sanitize_str(value: str, stack: list) -> str:
+    # Hash long strings that might contain content
+    if len(value) > 50:
+        if len(value) > HASH_CACHE_MAX_LENGTH:
+            return _hash_long(value)
+        return _hash_long_cached(value)
+    return value
+
+
+def _sanitize_scalar(value: Any, stack: list) -> Any:
+    return value
+
+
+def _sanitize_dict(value: Dict[str, Any], stack: list) -> Dict[str, Any]:
+    # Filled in later by the _sanitize_metadata loop
+    sanitized: Dict[str, Any] = _SanitizedDict()
+    stack.append((value, sanitized))
+    return sanitized
+
+
+def _sanitize_list(value: List[Any], stack: list) -> Tuple[Any, ...]:
+    sanitized = []
+    for item in value:
+        kind = type(item)
+        if kind is dict:
+            sanitized.append(_sanitize_dict(item, stack))
+        elif kind is str:
+            sanitized.append(_sanitize_str(item, stack))
+        elif kind is list or kind is tuple:
+            sanitized.append(_sanitize_list(item, stack))
+        elif kind is not _SanitizedDict and isinstance(item, dict):
+            sanitized.append(_sanitize_dict(item, stack))
+        else:
+            sanitized.append(item)
+    # A tuple, so the sanitized output can't be mutated behind the tag
+    return tuple(sanitized)
+
+
+def _sanitize_other(value: Any, stack: list) -> Any:
+    # Subclasses of the dispatched types take the slower isinstance path
+    if isinstance(value, str):
+        return _sanitize_str(value, stack)
+    if isinstance(value, (int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return _sanitize_dict(value, stack)
+    if isinstance(value, list):
+        return _sanitize_list(value, stack)
+    # Convert other types to string representation
+    return str(type(value).__name__)
+
+
+# Exact-type dispatch for _sanitize_metadata
+_SANITIZERS = {
+    str: _sanitize_str,
+    int: _sanitize_scalar,
+    float: _sanitize_scalar,
+    bool: _sanitize_scalar,
+    dict: _sanitize_dict,
+    list: _sanitize_list,
+    # Sanitized lists, when passed back in
+    tuple: _sanitize_list,
+    _SanitizedDict: _sanitize_scalar,
+}
+
+
+# Open instances, flushed at interpreter exit without being kept alive
+_LIVE_INSTANCES: 'weakref.WeakSet[WitnessTelemetry]' = weakref.WeakSet()
+
+
+def _flush_all():
+    for telemetry in list(_LIVE_INSTANCES):
+        try:
+            telemetry.flush()
+        except Exception as e:
+            print(f"Warning: Failed to flush telemetry at exit: {e}")
+
+
+atexit.register(_flush_all)
 
 
 class WitnessTelemetry:
     """Core witness telemetry logging system."""
 
-    def __init__(self, log_dir: Optional[Path] = None, session_id: Optional[str] = None):
+    # Writer thread queue used by every instance created with shared=True
+    _shared_queue: ClassVar[Optional[Queue]] = None
+    _shared_queue_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, log_dir: Optional[Path] = None, session_id: Optional[str] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE, background_writer: bool = False,
+                 shared: bool = False):
         """Initialize telemetry logger.
 
         Args:
             log_dir: Directory for log files (default: ./telemetry_logs)
             session_id: Unique session identifier
+            batch_size: Events buffered before they are written to disk;
+                use 1 to write every event immediately
+            background_writer: Hand events to a writer thread so log_event
+                never blocks on disk I/O
+            shared: Use one writer thread for all shared instances in the
+                process instead of a thread per instance; implies
+                background_writer
         """
         self.log_dir = log_dir or Path('./telemetry_logs')
         self.log_dir.mkdir(exist_ok=True)
-        self.session_id = session_id or self._generate_session_id()
+        self.session_id = sys.intern(session_id or self._generate_session_id())
+        self._session_id_bytes = self.session_id.encode()
         self.event_count = 0
+        self.batch_size = batch_size
+        self._pending: List[bytes] = []
+        self._pending_keys: List[Tuple[str, str]] = []
+        self._pending_date: Optional[str] = None
+        self._log_handle: Optional[BinaryIO] = None
+        self._log_handle_date: Optional[str] = None
+        # Per date: (session_id, event_type) -> byte offsets of that session's lines
+        self._offset_index: Dict[str, Dict[Tuple[str, str], List[int]]] = {}
+        # Only a resumed session can have lines that predate this instance
+        self._resumed = session_id is not None
+
+        # Columnar projection of this session's events, one row per event
+        self._col_event_types = array('b')
+        self._col_fields = {field: array('i') for field in QUERY_FIELDS}
+        self._row_offsets = array('q')
+        self._row_dates: List[str] = []
+
+        # Handlers as registered, and the merged per-type tuples log_event runs
+        self._raw_handlers: Dict[str, List[Callable[[TelemetryEvent], Any]]] = {}
+        self._handler_dispatch: Dict[str, Tuple[Callable[[TelemetryEvent], Any], ...]] = {}
+
+        # Resumed sessions start from the events already in today's log, so
+        # counts and queries cover them too
+        if self._resumed:
+            self._seed_rows(time.strftime('%Y-%m-%d'))
+        self._session_event_count = len(self._row_offsets)
+
+        # Guards the pending batch, offset index and columns; taken by the
+        # synchronous log path, flush and the writer thread alike. Writers in
+        # other instances and processes are serialized by the log file lock
+        self._lock = threading.Lock()
+        self._queue: Optional[Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        if shared:
+            self._queue = self._get_shared_queue()
+        elif background_writer:
+            self._queue = Queue()
+            self._writer = threading.Thread(
+                target=self._writer_loop, args=(self._queue, batch_size, weakref.ref(self)),
+                name='telemetry-writer', daemon=True
+            )
+            self._writer.start()
+        _LIVE_INSTANCES.add(self)
 
     def _generate_session_id(self) -> str:
         """Generate unique session identifier."""
         timestamp = datetime.now().isoformat()
-        return hashlib.sha256(f"session_{timestamp}".encode()).hexdigest()[:16]
+        return hashlib.blake2b(f"session_{timestamp}".encode(), digest_size=8).hexdigest()
 
-    def _generate_event_id(self) -> str:
+    def _generate_event_id(self, timestamp_ns: int) -> str:
         """Generate unique event identifier."""
         self.event_count += 1
-        timestamp = datetime.now().isoformat()
-        return hashlib.sha256(f"event_{self.session_id}_{self.event_count}_{timestamp}".encode()).hexdigest()[:16]
+        nonce = f"_{self.event_count}_{timestamp_ns}".encode()
+        return hashlib.blake2b(b"event_" + self._session_id_bytes + nonce, digest_size=8).hexdigest()
 
     def log_event(self, event_type: EventType, metadata: Dict[str, Any]) -> str:
         """Log a telemetry event.
@@ -90,88 +386,568 @@ class WitnessTelemetry:
         Returns:
             Event ID for tracking
         """
+        timestamp_ns = time.time_ns()
         event = TelemetryEvent(
             event_type=event_type,
-            timestamp=datetime.now(),
-            event_id=self._generate_event_id(),
+            timestamp=timestamp_ns,
+            event_id=self._generate_event_id(timestamp_ns),
             session_id=self.session_id,
             metadata=self._sanitize_metadata(metadata)
         )
 
         # Save to file
         self._save_event(event)
+        self._session_event_count += 1
+
+        if self._raw_handlers:
+            self._dispatch_event(event)
 
         return event.event_id
 
+    def _seed_rows(self, date_str: str):
+        """Add a resumed session's logged events to the columnar projection."""
+        for offset, event in self._iter_session_lines(date_str):
+            self._append_row(event)
+            self._row_offsets.append(offset)
+            self._row_dates.append(date_str)
+
+    def _append_row(self, event: TelemetryEvent):
+        """Add an event's queryable fields to the columnar projection."""
+        self._col_event_types.append(_EVENT_TYPE_CODES[event.event_type])
+        for field in QUERY_FIELDS:
+            value = event.metadata.get(field)
+            if type(value) is str:
+                codes = _FIELD_CODES[field]
+                code = codes.get(value)
+                if code is None:
+                    with _FIELD_CODES_LOCK:
+                        code = codes.setdefault(value, len(codes))
+            else:
+                code = -1
+            self._col_fields[field].append(code)
+
+    def register_handler(self, event_type: Union[EventType, str], handler: Callable[[TelemetryEvent], Any]):
+        """Call handler for every logged event of a type.
+
+        Args:
+            event_type: Event type or its value; '*' matches every event
+            handler: Called with the logged TelemetryEvent
+        """
+        key = event_type.value if isinstance(event_type, EventType) else event_type
+        self._raw_handlers.setdefault(key, []).append(handler)
+        self._handler_dispatch.clear()
+
+    def _dispatch_event(self, event: TelemetryEvent):
+        """Run the handlers for an event; a failing handler doesn't stop the rest."""
+        type_value = event.event_type.value
+        handlers = self._handler_dispatch.get(type_value)
+        if handlers is None:
+            handlers = tuple(self._raw_handlers.get(type_value, ())) + tuple(self._raw_handlers.get('*', ()))
+            self._handler_dispatch[type_value] = handlers
+
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception as e:
+                print(f"Warning: Telemetry handler {getattr(handler, '__name__', handler)!r} failed: {e}")
+
     def _sanitize_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Sanitize metadata to ensure no sensitive content.
 
-        This removes or hashes any potentially sensitive fields.
+        This removes or hashes any potentially sensitive fields. Output
+        of an earlier call, at any nesting level, is reused as is.
         """
-        sanitized = {}
-
-        for key, value in metadata.items():
-            if isinstance(value, str):
-                # Hash long strings that might contain content
-                if len(value) > 50:
-                    sanitized[key] = hashlib.sha256(value.encode()).hexdigest()[:16] + "..."
-                else:
-                    sanitized[key] = value
-            elif isinstance(value, (int, float, bool)):
-                sanitized[key] = value
-            elif isinstance(value, dict):
-                sanitized[key] = self._sanitize_metadata(value)
-            elif isinstance(value, list):
-                sanitized[key] = [self._sanitize_metadata({'item': item})['item'] if isinstance(item, dict) else item for item in value]
-            else:
-                # Convert other types to string representation
-                sanitized[key] = str(type(value).__name__)
+        if type(metadata) is _SanitizedDict:
+            return metadata
+
+        sanitized = _SanitizedDict()
+
+        # Nested dicts are filled in from an explicit stack instead of recursing
+        stack = [(metadata, sanitized)]
+        while stack:
+            source, target = stack.pop()
+            for key, value in source.items():
+                # Keys come from a small vocabulary, so share one copy of each
+                if type(key) is str:
+                    key = sys.intern(key)
+                _dict_setitem(target, key, _SANITIZERS.get(type(value), _sanitize_other)(value, stack))
 
         return sanitized
 
     def _save_event(self, event: TelemetryEvent):
-        """Save event to log file."""
-        # Create daily log file
-        date_str = event.timestamp.strftime('%Y-%m-%d')
-        log_file = self.log_dir / f'telemetry_{date_str}.jsonl'
-
-        # Append event as JSON line
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(event.to_dict()) + "\n")
-")
-')
+        """Buffer event for its daily log file."""
+        # Serialize up front so an unserializable event fails in log_event,
+        # with or without a writer thread
+        line = event.to_json_bytes() + b"\n"
+        if self._queue is not None:
+            self._queue.put((self, event, line))
+            return
+
+        # Guards the batch and columns against other threads logging here
+        with self._lock:
+            self._buffer_event(event, line)
+            if len(self._pending) >= self.batch_size:
+                self._write_pending()
+
+    def _buffer_event(self, event: TelemetryEvent, line: bytes):
+        """Append an event's serialized log line to the pending batch."""
+        date_str = time.strftime('%Y-%m-%d', time.localtime(event.timestamp // 1_000_000_000))
+        if date_str != self._pending_date:
+            self._write_pending()
+            self._pending_date = date_str
+
+        self._pending.append(line)
+        self._pending_keys.append((event.session_id, event.event_type.value))
+        # Kept in write order so row i lines up with the i-th recorded offset
+        self._append_row(event)
 
-    def get_session_events(self, limit: int = 100) -> List[TelemetryEvent]:
+    @classmethod
+    def _get_shared_queue(cls) -> Queue:
+        """Get the shared writer queue, starting its thread on first use."""
+        with cls._shared_queue_lock:
+            if cls._shared_queue is None:
+                queue = Queue()
+                threading.Thread(
+                    target=cls._writer_loop, args=(queue, DEFAULT_BATCH_SIZE),
+                    name='telemetry-writer-shared', daemon=True
+                ).start()
+                cls._shared_queue = queue
+            return cls._shared_queue
+
+    @staticmethod
+    def _writer_loop(queue: Queue, batch_size: int, owner: Optional['weakref.ref[WitnessTelemetry]'] = None):
+        """Drain queued (telemetry, event, line) items to disk in batches.
+
+        A None item stops the loop. A private writer also stops once its
+        owner has been garbage collected; the loop itself keeps no
+        reference to an instance between batches.
+        """
+        timeout = WRITER_IDLE_TIMEOUT if owner is not None else None
+        while True:
+            try:
+                batch = [queue.get(timeout=timeout)]
+            except Empty:
+                if owner() is None:
+                    return
+                continue
+            while len(batch) < batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except Empty:
+                    break
+
+            stop = WitnessTelemetry._write_batch(batch)
+            for _ in range(len(batch)):
+                queue.task_done()
+            del batch
+            if stop:
+                return
+
+    @staticmethod
+    def _write_batch(batch: List[Optional[Tuple['WitnessTelemetry', TelemetryEvent, bytes]]]) -> bool:
+        """Buffer and write one batch of queued items; True if it held a stop item."""
+        # Events keep their queue order within each instance
+        by_instance: Dict[WitnessTelemetry, List[Tuple[TelemetryEvent, bytes]]] = {}
+        for item in batch:
+            if item is not None:
+                by_instance.setdefault(item[0], []).append(item[1:])
+
+        for telemetry, events in by_instance.items():
+            with telemetry._lock:
+                # A failing event must not take the rest of the batch with it
+                for event, line in events:
+                    try:
+                        telemetry._buffer_event(event, line)
+                    except Exception as e:
+                        print(f"Warning: Failed to buffer telemetry event {event.event_id}: {e}")
+                try:
+                    telemetry._write_pending()
+                except Exception as e:
+                    print(f"Warning: Failed to write telemetry events: {e}")
+
+        return len(by_instance) < len(batch) and None in batch
+
+    def flush(self):
+        """Write buffered events to the daily log file."""
+        if self._queue is not None:
+            self._queue.join()
+        with self._lock:
+            self._write_pending()
+
+    def _write_pending(self):
+        """Write the pending batch and update the offset index."""
+        if not self._pending:
+            return
+
+        if self._log_handle_date != self._pending_date:
+            if self._log_handle is not None:
+                self._log_handle.close()
+            log_file = self.log_dir / f'telemetry_{self._pending_date}.jsonl'
+            self._log_handle = open(log_file, 'ab')
+            self._log_handle_date = self._pending_date
+
+        # One write per batch instead of an open/write/close per event. Other
+        # instances and processes append to the same log, so the batch's
+        # position is only known while the lock is held
+        index = self._index_for(self._pending_date, create=True)
+        added: Dict[str, List[int]] = {}
+        with _append_lock(self._log_handle):
+            offset = self._log_handle.seek(0, os.SEEK_END)
+            self._log_handle.write(b"".join(self._pending))
+            self._log_handle.flush()
+
+            # Record where each line landed so session reads can seek to it
+            for key, line in zip(self._pending_keys, self._pending):
+                index.setdefault(key, []).append(offset)
+                added.setdefault(key[1], []).append(offset)
+                self._row_offsets.append(offset)
+                self._row_dates.append(self._pending_date)
+                offset += len(line)
+
+            # Each flush appends one JSON line with just the offsets it added
+            with open(self._index_path(self._pending_date), 'ab') as f:
+                f.write(_dumps({'session_id': self.session_id, 'offsets': added}) + b"\n")
+        self._pending.clear()
+        self._pending_keys.clear()
+
+    def _index_path(self, date_str: str) -> Path:
+        """Sidecar file holding every session's offsets into a daily log."""
+        return self.log_dir / f'telemetry_{date_str}.idx'
+
+    def _index_for(self, date_str: str, create: bool = False) -> Optional[Dict[Tuple[str, str], List[int]]]:
+        """Get this session's offset index for a daily log, loading its sidecar.
+
+        Returns None when the session has no index for that date, unless
+        create is set.
+        """
+        index = self._offset_index.get(date_str)
+        if index is not None:
+            return index
+
+        index = {}
+        index_path = self._index_path(date_str)
+        if self._resumed and index_path.exists():
+            with open(index_path, 'rb') as f:
+                for line in f:
+                    try:
+                        record = _loads(line)
+                        if record['session_id'] != self.session_id:
+                            continue
+                        for type_value, offsets in record['offsets'].items():
+                            index.setdefault((self.session_id, type_value), []).extend(offsets)
+                    except (KeyError, TypeError, ValueError, AttributeError):
+                        # A line cut short by a crash, or not a sidecar record
+                        continue
+        if not index and not create:
+            return None
+        self._offset_index[date_str] = index
+        return index
+
+    def close(self):
+        """Flush buffered events and release the log file."""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        self.flush()
+        self._queue = None
+        if self._log_handle is not None:
+            self._log_handle.close()
+            self._log_handle = None
+            self._log_handle_date = None
+        _LIVE_INSTANCES.discard(self)
+
+    def __enter__(self) -> 'WitnessTelemetry':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_session_events(self, limit: int = 100, event_type: Optional[EventType] = None) -> List[TelemetryEvent]:
         """Get recent events for current session.
 
         Args:
             limit: Maximum number of events to return
+            event_type: Only return events of this type
 
         Returns:
             List of telemetry events
         """
-        events = []
+        return list(islice(self.iter_session_events(event_type), limit))
+
+    def iter_session_events(self, event_type: Optional[EventType] = None) -> Iterator[TelemetryEvent]:
+        """Lazily read today's events for current session, oldest first.
+
+        Lines are only decoded as they are consumed, so callers that stop
+        early never parse the rest of the log.
 
-        # Read from today's log file
-        date_str = datetime.now().strftime('%Y-%m-%d')
+        Args:
+            event_type: Only yield events of this type
+        """
+        self.flush()
+        for _, event in self._iter_session_lines(datetime.now().strftime('%Y-%m-%d'), event_type):
+            yield event
+
+    def _iter_session_lines(self, date_str: str,
+                            event_type: Optional[EventType] = None) -> Iterator[Tuple[int, TelemetryEvent]]:
+        """Yield (offset, event) for this session's lines in a daily log, oldest first."""
         log_file = self.log_dir / f'telemetry_{date_str}.jsonl'
+        if not log_file.exists():
+            return
+
+        index = self._index_for(date_str)
+        if index is not None:
+            # Seek straight to this session's lines instead of scanning the file
+            offsets = heapq.merge(*(
+                positions for (session_id, type_value), positions in index.items()
+                if session_id == self.session_id and (event_type is None or type_value == event_type.value)
+            ))
+            seen = set()
+            for offset, raw in self._read_lines_at(log_file, offsets):
+                try:
+                    event = TelemetryEvent.from_dict(_loads(raw))
+                except (KeyError, TypeError, ValueError):
+                    event = None
+                if (event is None or event.session_id != self.session_id
+                        or (event_type is not None and event.event_type != event_type)):
+                    # The index points at a line that isn't ours, so stop
+                    # trusting it and scan for the rest
+                    break
+                seen.add(event.event_id)
+                yield offset, event
+            else:
+                return
+        else:
+            # No index for this session, e.g. logs written before indexing
+            seen = ()
+
+        for offset, raw in self._scan_lines(log_file, self._session_id_bytes):
+            event = TelemetryEvent.from_dict(_loads(raw))
+            if (event.session_id == self.session_id and event.event_id not in seen
+                    and (event_type is None or event.event_type == event_type)):
+                yield offset, event
+
+    @staticmethod
+    def _map_log(f: BinaryIO) -> Optional[mmap.mmap]:
+        """Map a log file read-only; None if it is empty or cannot be mapped."""
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return None
 
-        if log_file.exists():
-            with open(log_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        event_data = json.loads(line)
-                        event = TelemetryEvent.from_dict(event_data)
-                        if event.session_id == self.session_id:
-                            events.append(event)
-                            if len(events) >= limit:
-                                break
+    @classmethod
+    def _read_lines_at(cls, log_file: Path, offsets: Iterator[int]) -> Iterator[Tuple[int, bytes]]:
+        """Yield (offset, line) for the log lines starting at the given byte offsets."""
+        with open(log_file, 'rb') as f:
+            mm = cls._map_log(f)
+            if mm is None:
+                for offset in offsets:
+                    f.seek(offset)
+                    yield offset, f.readline()
+                return
+
+            with mm:
+                size = len(mm)
+                for offset in offsets:
+                    # Lines appended after the file was mapped are not visible
+                    if offset >= size:
+                        return
+                    end = mm.find(b'\n', offset)
+                    yield offset, mm[offset:end if end >= 0 else size]
+
+    @classmethod
+    def _scan_lines(cls, log_file: Path, needle: bytes) -> Iterator[Tuple[int, bytes]]:
+        """Yield (offset, line) for the log lines that contain needle, skipping the rest unread."""
+        with open(log_file, 'rb') as f:
+            mm = cls._map_log(f)
+            if mm is None:
+                offset = 0
+                for raw in f:
+                    if needle in raw:
+                        yield offset, raw
+                    offset += len(raw)
+                return
+
+            with mm:
+                size = len(mm)
+                start = 0
+                while start < size:
+                    end = mm.find(b'\n', start)
+                    if end < 0:
+                        end = size
+                    # Search the mapping in place so skipped lines are never copied
+                    if mm.find(needle, start, end) >= 0:
+                        yield start, mm[start:end]
+                    start = end + 1
+
+    def query_events(self, event_type: Optional[EventType] = None, limit: int = 100,
+                     filters: Optional[Dict[str, Any]] = None) -> List[TelemetryEvent]:
+        """Query this session's events by type and metadata fields.
+
+        Covers the events logged through this instance and, for a resumed
+        session, those already in that day's log when it was opened.
+        Filters are evaluated over the dictionary-encoded columns, vectorized
+        when numpy is available; only matching events are read back from
+        the log.
+
+        Args:
+            event_type: Only return events of this type
+            limit: Maximum number of events to return
+            filters: Required values for 'event_type' or fields in QUERY_FIELDS
+
+        Returns:
+            List of telemetry events, oldest first
+        """
+        filters = dict(filters or {})
+        type_filter = filters.pop('event_type', None)
+        unknown = set(filters) - set(QUERY_FIELDS)
+        if unknown:
+            raise QueryError(
+                f"Cannot filter on {', '.join(sorted(unknown))}; "
+                f"queryable fields are {('event_type',) + QUERY_FIELDS}"
+            )
+
+        self.flush()
+
+        # Resolve values to codes; a value never logged matches nothing
+        conditions = []
+        if event_type is not None:
+            conditions.append((self._col_event_types, _EVENT_TYPE_CODES[event_type]))
+        if type_filter is not None:
+            if not isinstance(type_filter, EventType):
+                try:
+                    type_filter = _EVENT_TYPE_LOOKUP(type_filter)
+                except (KeyError, TypeError):
+                    return []
+            conditions.append((self._col_event_types, _EVENT_TYPE_CODES[type_filter]))
+        for field, value in filters.items():
+            code = _FIELD_CODES[field].get(value)
+            if code is None:
+                return []
+            conditions.append((self._col_fields[field], code))
+
+        rows = range(len(self._row_offsets))
+        if conditions and NUMPY_AVAILABLE:
+            mask = np.ones(len(self._row_offsets), dtype=bool)
+            for column, code in conditions:
+                # Rows logged after the flush have no offset yet; leave them out
+                mask &= np.frombuffer(column, dtype=column.typecode)[:len(mask)] == code
+            rows = np.flatnonzero(mask)
+        elif conditions:
+            rows = [i for i in rows if all(column[i] == code for column, code in conditions)]
+
+        events = []
+        handles: Dict[str, BinaryIO] = {}
+        try:
+            for i in islice(rows, limit):
+                date_str = self._row_dates[i]
+                f = handles.get(date_str)
+                if f is None:
+                    f = handles[date_str] = open(self.log_dir / f'telemetry_{date_str}.jsonl', 'rb')
+                f.seek(self._row_offsets[i])
+                events.append(TelemetryEvent.from_dict(_loads(f.readline())))
+        finally:
+            for f in handles.values():
+                f.close()
 
         return events
 
     def get_event_count(self) -> int:
         """Get total number of events logged in current session."""
-        return len(self.get_session_events(limit=1000))
+        return self._session_event_count
+
+    def export_parquet(self, dataset_dir: Path, date: Optional[str] = None) -> Path:
+        """Export a daily log to a columnar Parquet dataset.
+
+        The dataset is partitioned by date and event type. Session IDs are
+        dictionary-encoded so session filters compare integer codes, and
+        metadata is kept as a JSON string column.
+
+        Args:
+            dataset_dir: Root directory of the Parquet dataset
+            date: Day to export as YYYY-MM-DD (default: today)
+
+        Returns:
+            The dataset directory
+        """
+        if not PYARROW_AVAILABLE:
+            raise ExportError("Parquet export requires pyarrow")
+
+        self.flush()
+        date_str = date or datetime.now().strftime('%Y-%m-%d')
+        log_file = self.log_dir / f'telemetry_{date_str}.jsonl'
+        if not log_file.exists():
+            raise ExportError(f"No telemetry log for {date_str}")
+
+        columns: Dict[str, List[Any]] = {
+            'event_type': [], 'timestamp': [], 'event_id': [], 'session_id': [], 'metadata': []
+        }
+        with open(log_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    event_data = _loads(line)
+                    columns['event_type'].append(event_data['event_type'])
+                    columns['timestamp'].append(datetime.fromisoformat(event_data['timestamp']))
+                    columns['event_id'].append(event_data['event_id'])
+                    columns['session_id'].append(event_data['session_id'])
+                    columns['metadata'].append(_dumps(event_data['metadata']).decode())
+
+        table = pa.table({
+            'date': pa.array([date_str] * len(columns['event_id']), pa.string()),
+            'event_type': pa.array(columns['event_type'], pa.string()),
+            'timestamp': pa.array(columns['timestamp'], pa.timestamp('us')),
+            'event_id': pa.array(columns['event_id'], pa.string()),
+            'session_id': pa.array(columns['session_id'], pa.string()).dictionary_encode(),
+            'metadata': pa.array(columns['metadata'], pa.string())
+        })
+        # The log is append-only, so each export is a full snapshot of its day;
+        # replace that day's partitions rather than adding files beside them
+        pq.write_to_dataset(
+            table,
+            root_path=str(dataset_dir),
+            partition_cols=['date', 'event_type'],
+            existing_data_behavior='delete_matching'
+        )
+        return dataset_dir
+
+    def get_session_events_parquet(self, dataset_dir: Path, event_type: Optional[EventType] = None,
+                                   limit: int = 100) -> List[TelemetryEvent]:
+        """Get events for current session from an exported Parquet dataset.
+
+        Session and event type filters are pushed down to the Parquet
+        reader, so non-matching partitions and row groups are skipped.
+
+        Args:
+            dataset_dir: Root directory written by export_parquet
+            event_type: Only return events of this type
+            limit: Maximum number of events to return
+
+        Returns:
+            List of telemetry events
+        """
+        if not PYARROW_AVAILABLE:
+            raise ExportError("Parquet queries require pyarrow")
+
+        filters = [('session_id', '=', self.session_id)]
+        if event_type is not None:
+            filters.append(('event_type', '=', event_type.value))
+
+        table = pq.read_table(
+            str(dataset_dir),
+            columns=['event_type', 'timestamp', 'event_id', 'session_id', 'metadata'],
+            filters=filters
+        ).sort_by('timestamp').slice(0, limit)
+
+        return [
+            TelemetryEvent(
+                event_type=EventType(str(row['event_type'])),
+                timestamp=round(row['timestamp'].timestamp() * 1_000_000) * 1000,
+                event_id=row['event_id'],
+                session_id=row['session_id'],
+                metadata=_loads(row['metadata'])
+            )
+            for row in table.to_pylist()
+        ]
 
 
 class TelemetryLogger:
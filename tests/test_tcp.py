@@ -0,0 +1,137 @@
+"""
+Tests for the Trajectory Checkpoint Protocol SQLite store and the controller built on it.
+"""
+
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import sqlite3
+
+import pytest
+
+from python.helpers.tcp_tcpc import tcp
+from python.helpers.tcp_tcpc.tcp import CheckpointType, TrajectoryCheckpointProtocol
+from python.helpers.tcp_tcpc.tcpc import TrajectoryCheckpointController
+
+
+def _ids(checkpoints):
+    return {checkpoint.checkpoint_id for checkpoint in checkpoints}
+
+
+def test_transaction_rollback_discards_checkpoints(tmp_path):
+    store = TrajectoryCheckpointProtocol(str(tmp_path))
+    kept = store.create_checkpoint('drayl', {'step': 0}, 0.9)
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            lost = store.create_checkpoint('drayl', {'step': 1}, 0.8)
+            store.list_checkpoints()
+            raise RuntimeError
+
+    assert store.get_checkpoint(lost.checkpoint_id) is None
+    assert _ids(store.list_checkpoints('drayl')) == {kept.checkpoint_id}
+    assert [row['checkpoint_id'] for row in store.get_alignment_history('drayl')] == [kept.checkpoint_id]
+
+    # Rowids freed by the rollback are reused by the next writer and still picked up
+    other = TrajectoryCheckpointProtocol(str(tmp_path))
+    added = other.create_checkpoint('drayl', {'step': 2}, 0.7)
+    assert _ids(store.list_checkpoints('drayl')) == {kept.checkpoint_id, added.checkpoint_id}
+
+
+def test_readers_see_other_writers(tmp_path):
+    first = TrajectoryCheckpointProtocol(str(tmp_path))
+    second = TrajectoryCheckpointProtocol(str(tmp_path))
+    first.create_checkpoint('drayl', {'a': 1}, 0.9)
+    theirs = second.create_checkpoint('drayl', {'b': 1}, 0.7)
+
+    listed = first.list_checkpoints('drayl')
+    history = first.get_alignment_history('drayl')
+    assert [c.checkpoint_id for c in listed] == [row['checkpoint_id'] for row in history]
+    assert theirs.checkpoint_id in _ids(listed)
+    assert first.find_checkpoints({'b': 1}) == [theirs]
+
+
+def test_get_checkpoint_miss_stays_in_memory(tmp_path):
+    store = TrajectoryCheckpointProtocol(str(tmp_path))
+    store.create_checkpoint('drayl', {'a': 1}, 0.9)
+    statements = []
+    store._conn.set_trace_callback(statements.append)
+
+    assert store.get_checkpoint('non_existent_id') is None
+    assert statements == []
+
+
+def test_migrate_v1_to_v2(tmp_path):
+    state = {'user': 'alice', 'action': 'login'}
+    state_hash = tcp._hash_canonical(tcp._canonicalize(state))
+    conn = sqlite3.connect(str(tmp_path / tcp.CHECKPOINT_DB_NAME))
+    conn.execute(
+        "CREATE TABLE checkpoints (checkpoint_id TEXT PRIMARY KEY, timestamp TEXT NOT NULL, "
+        "drayl_id TEXT NOT NULL, state_hash TEXT NOT NULL, alignment_score REAL NOT NULL, "
+        "metadata TEXT NOT NULL)"
+    )
+    conn.execute(
+        "INSERT INTO checkpoints VALUES (?, ?, ?, ?, ?, ?)",
+        ('tcp_v1', '2026-01-01T00:00:00', 'drayl', state_hash, 0.5, '{"phase": "auth"}')
+    )
+    conn.execute("PRAGMA user_version = 1")
+    conn.commit()
+    conn.close()
+
+    store = TrajectoryCheckpointProtocol(str(tmp_path))
+    checkpoint = store.get_checkpoint('tcp_v1')
+    assert checkpoint.metadata == {'phase': 'auth'}
+    assert checkpoint.state_keys is None and checkpoint.state_size is None
+    assert store.verify_checkpoint(checkpoint, state)
+    assert not store.verify_checkpoint(checkpoint, {'user': 'bob', 'action': 'login'})
+
+    assert store._conn.execute("PRAGMA user_version").fetchone()[0] == tcp._SCHEMA_VERSION
+    columns = {row[1] for row in store._conn.execute("PRAGMA table_info(checkpoints)")}
+    assert {'state_keys', 'state_size'} <= columns
+
+    added = store.create_checkpoint('drayl', state, 0.9)
+    assert added.state_keys == 2
+    store.close()
+    assert TrajectoryCheckpointProtocol(str(tmp_path)).get_checkpoint(added.checkpoint_id) == added
+
+
+def test_legacy_json_checkpoints_are_imported(tmp_path):
+    legacy = {
+        'checkpoint_id': 'tcp_legacy', 'timestamp': '2025-01-01T00:00:00', 'drayl_id': 'old',
+        'state_hash': 'ab', 'alignment_score': 0.5, 'metadata': {'a': 1}
+    }
+    (tmp_path / 'tcp_legacy.json').write_text(json.dumps(legacy))
+
+    store = TrajectoryCheckpointProtocol(str(tmp_path))
+    assert store.get_checkpoint('tcp_legacy').metadata == {'a': 1}
+    store.close()
+
+    # Imported once; the database is the source of truth afterwards
+    (tmp_path / 'tcp_legacy.json').unlink()
+    assert TrajectoryCheckpointProtocol(str(tmp_path)).get_checkpoint('tcp_legacy') is not None
+
+
+def test_wide_integer_metadata_round_trips(tmp_path):
+    store = TrajectoryCheckpointProtocol(str(tmp_path))
+    checkpoint = store.create_checkpoint('drayl', {'a': 1}, 0.9, {'big': 2 ** 70})
+    assert str(2 ** 70) in checkpoint.to_json()
+    store.close()
+    reloaded = TrajectoryCheckpointProtocol(str(tmp_path)).get_checkpoint(checkpoint.checkpoint_id)
+    assert reloaded.metadata['big'] == 2 ** 70
+
+
+def test_controller_loads_lazily(tmp_path):
+    existing = TrajectoryCheckpointProtocol(str(tmp_path))
+    old = existing.create_checkpoint('state_change', {'x': 1}, 0.5)
+    existing.close()
+
+    controller = TrajectoryCheckpointController(tmp_path, session_id='session')
+    assert controller.tcp._conn is None and controller.tcp.checkpoints == {}
+
+    ids = controller.process_governance_event('state_change', {'from_state': 'a', 'to_state': 'b'})
+    assert len(ids) == 1 and old.checkpoint_id not in controller.tcp.checkpoints
+
+    created = controller.tcp.get_checkpoint(ids[0])
+    assert created.metadata['checkpoint_type'] == CheckpointType.STATE_TRANSITION.value
+    assert _ids(controller.tcp.list_checkpoints('state_change')) == {old.checkpoint_id, ids[0]}
@@ -0,0 +1,173 @@
+"""
+Tests for the witness telemetry writer, offset index and query paths.
+"""
+
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gc
+import json
+import threading
+import weakref
+
+import pytest
+
+from python.helpers.witness_telemetry import telemetry
+from python.helpers.witness_telemetry.telemetry import EventType, WitnessTelemetry
+from python.helpers.witness_telemetry.exceptions import QueryError
+
+
+def _within(func, timeout=10):
+    """Run func on a helper thread and fail instead of hanging if it blocks."""
+    result = {}
+    thread = threading.Thread(target=lambda: result.setdefault('value', func()), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), f"{func} did not return within {timeout}s"
+    return result.get('value')
+
+
+def test_drop_shared_instance_then_log(tmp_path):
+    keeper = WitnessTelemetry(log_dir=tmp_path, shared=True)
+    for _ in range(5):
+        dropped = WitnessTelemetry(log_dir=tmp_path, shared=True)
+        for i in range(20):
+            dropped.log_event(EventType.HEALTH_CHECK, {'i': i})
+        del dropped
+        gc.collect()
+        for i in range(20):
+            keeper.log_event(EventType.HEALTH_CHECK, {'i': i})
+
+    _within(keeper.flush)
+    assert len(_within(lambda: keeper.get_session_events(limit=1000))) == 100
+    keeper.close()
+
+
+@pytest.mark.parametrize('options', [{}, {'background_writer': True}, {'shared': True}])
+def test_bad_event_does_not_drop_others(tmp_path, options):
+    with WitnessTelemetry(log_dir=tmp_path, **options) as witness:
+        witness.log_event(EventType.QUERY_RECEIVED, {'n': 0})
+        with pytest.raises(TypeError):
+            witness.log_event(EventType.QUERY_RECEIVED, {'bad': [{1, 2}]})
+        for n in range(1, 6):
+            witness.log_event(EventType.QUERY_RECEIVED, {'n': n})
+
+        events = witness.get_session_events()
+        assert [event.metadata['n'] for event in events] == list(range(6))
+        assert witness.get_event_count() == 6
+
+
+def test_background_instance_is_released(tmp_path):
+    witness = WitnessTelemetry(log_dir=tmp_path, background_writer=True)
+    witness.log_event(EventType.HEALTH_CHECK, {'status': 'ok'})
+    witness.flush()
+    writer = witness._writer
+    ref = weakref.ref(witness)
+    del witness
+    gc.collect()
+
+    assert ref() is None
+    writer.join(telemetry.WRITER_IDLE_TIMEOUT * 5)
+    assert not writer.is_alive()
+
+
+def test_resume_from_sidecar(tmp_path):
+    with WitnessTelemetry(log_dir=tmp_path, session_id='resumed', batch_size=2) as first:
+        for i in range(5):
+            first.log_event(EventType.CLASSIFICATION_COMPLETE, {'risk_level': 'HIGH' if i % 2 else 'LOW'})
+    with WitnessTelemetry(log_dir=tmp_path, batch_size=2) as other:
+        other.log_event(EventType.HEALTH_CHECK, {'status': 'ok'})
+
+    sidecars = list(tmp_path.glob('*.idx'))
+    assert len(sidecars) == 1
+    records = [json.loads(line) for line in sidecars[0].read_text().splitlines()]
+    assert {record['session_id'] for record in records} == {'resumed', other.session_id}
+
+    with WitnessTelemetry(log_dir=tmp_path, session_id='resumed') as resumed:
+        assert resumed._index_for(resumed._row_dates[0]) is not None
+        resumed.log_event(EventType.HEALTH_CHECK, {'status': 'ok'})
+
+        assert resumed.get_event_count() == 6
+        assert len(resumed.get_session_events()) == 6
+        assert len(resumed.query_events()) == 6
+        assert len(resumed.query_events(filters={'risk_level': 'HIGH'})) == 2
+        assert len(resumed.query_events(filters={'event_type': 'classification_complete'})) == 5
+
+
+def test_stale_sidecar_falls_back_to_scan(tmp_path):
+    with WitnessTelemetry(log_dir=tmp_path, session_id='stale', batch_size=1) as witness:
+        for i in range(3):
+            witness.log_event(EventType.HEALTH_CHECK, {'i': i})
+    with WitnessTelemetry(log_dir=tmp_path, batch_size=1) as other:
+        other.log_event(EventType.HEALTH_CHECK, {'i': 99})
+
+    # An index record pointing at another session's line, then a torn tail
+    sidecar = next(tmp_path.glob('*.idx'))
+    with open(sidecar, 'a') as f:
+        f.write(json.dumps({'session_id': 'stale', 'offsets': {'health_check': [other._row_offsets[0]]}}))
+        f.write('\n{"session_id": "st')
+
+    resumed = WitnessTelemetry(log_dir=tmp_path, session_id='stale')
+    events = resumed.get_session_events()
+    assert [event.metadata['i'] for event in events] == [0, 1, 2]
+    assert all(event.session_id == 'stale' for event in events)
+
+
+def test_concurrent_instances_keep_their_own_events(tmp_path):
+    instances = [WitnessTelemetry(log_dir=tmp_path, batch_size=8) for _ in range(4)]
+
+    def work(witness):
+        for i in range(500):
+            witness.log_event(EventType.QUERY_RECEIVED, {'i': i})
+
+    threads = [threading.Thread(target=work, args=(witness,)) for witness in instances]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for witness in instances:
+        events = witness.get_session_events(limit=1000)
+        assert len(events) == 500
+        assert all(event.session_id == witness.session_id for event in events)
+        witness.close()
+
+
+def test_query_rejects_unknown_fields(tmp_path):
+    with WitnessTelemetry(log_dir=tmp_path) as witness:
+        with pytest.raises(QueryError):
+            witness.query_events(filters={'invalid_field': 'test'})
+
+
+def test_sanitized_metadata_is_read_only(tmp_path):
+    seen = []
+    with WitnessTelemetry(log_dir=tmp_path) as witness:
+        witness.register_handler('*', lambda event: seen.append(event.metadata))
+        witness.log_event(EventType.QUERY_RECEIVED, {'nested': {'a': 1}, 'items': ['x']})
+
+        metadata = seen[0]
+        with pytest.raises(TypeError):
+            metadata['raw'] = 'y' * 80
+        with pytest.raises(TypeError):
+            metadata['nested']['raw'] = 'y' * 80
+        with pytest.raises(AttributeError):
+            metadata['items'].append('y' * 80)
+
+        witness.log_event(EventType.QUERY_RECEIVED, dict(metadata, raw='y' * 80))
+        assert seen[1]['raw'].endswith('...')
+
+
+def test_parquet_reexport_replaces_partitions(tmp_path):
+    pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+
+    dataset = tmp_path / 'dataset'
+    with WitnessTelemetry(log_dir=tmp_path) as witness:
+        for i in range(3):
+            witness.log_event(EventType.HEALTH_CHECK, {'i': i})
+        witness.export_parquet(dataset)
+        witness.log_event(EventType.ERROR_OCCURRED, {'i': 3})
+        witness.export_parquet(dataset)
+        witness.export_parquet(dataset)
+
+    assert pq.read_table(str(dataset)).num_rows == 4